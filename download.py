@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 import requests
-from bs4 import BeautifulSoup
 import re
 import json
 import os
@@ -8,9 +7,18 @@ import datetime
 import logging
 import time
 import argparse
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple, Any, TextIO
+import functools
+import operator
+import gzip
+import mmap
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Any, TextIO, BinaryIO
 from http.cookies import SimpleCookie
+from types import MappingProxyType
 import hashlib
 import sys
 from colorama import init, Fore, Back, Style
@@ -18,6 +26,66 @@ from colorama import init, Fore, Back, Style
 # Initialize colorama for cross-platform color support
 init()
 
+# Use the C-based lxml tree builder for BeautifulSoup when it is installed;
+# html.parser is pure Python and dominates parse time on the large OTA pages
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Only the image tables, their links and the device headings above them are
+# ever inspected, so skip building the rest of the document tree
+PAGE_STRAINER_TAGS = ("table", "tr", "a", "h2")
+
+# BeautifulSoup is imported on first parse, so runs served from the parse
+# cache (and --help) never pay for loading it
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+# orjson is a much faster JSON codec for the page caches; fall back to the
+# standard library when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes, compact or indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _json_text(obj: Any) -> str:
+    """Serialize obj to a compact single-line JSON string for output."""
+    return _json_dumps(obj).decode('utf-8')
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize JSON from bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _atomic_write_bytes(path: str, data: bytes) -> None:
+    """
+    Write data to path atomically.
+    
+    The data goes to a temporary file next to path that is then renamed over
+    path, so readers never see a partially written file. Everything written
+    this way is a regenerable cache, so the data is not fsynced.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
 # Custom formatter for colored output
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colored output"""
@@ -30,16 +98,21 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': Fore.RED + Back.WHITE
     }
     
+    # Colored level names, built once instead of on every log call
+    COLORED_LEVELNAMES = {
+        level: f"{color}{level}{Style.RESET_ALL}"
+        for level, color in COLORS.items()
+    }
+    
     def format(self, record):
-        # Add color to the level name
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{Style.RESET_ALL}"
-        
-        # Add color to the message based on level
-        if record.levelname in self.COLORS:
-            record.msg = f"{self.COLORS[record.levelname]}{record.msg}{Style.RESET_ALL}"
-        
-        return super().format(record)
+        # Add color to the level name, restoring it afterwards so other
+        # handlers (like the log file) still see the plain level name
+        levelname = record.levelname
+        record.levelname = self.COLORED_LEVELNAMES.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 # Set up logging with custom formatter
 def setup_logging(debug: bool = False, json_output: bool = False):
@@ -52,9 +125,11 @@ def setup_logging(debug: bool = False, json_output: bool = False):
     # Clear any existing handlers
     logger.handlers = []
     
-    # Create console handler with custom formatter
+    # Create console handler with custom formatter; colors are only useful
+    # when the console is a terminal, so skip them for pipes and log files
     console_handler = logging.StreamHandler()
-    console_formatter = ColoredFormatter(
+    formatter_class = ColoredFormatter if sys.stderr.isatty() else logging.Formatter
+    console_formatter = formatter_class(
         '%(asctime)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
@@ -96,26 +171,292 @@ logger = setup_logging()
 # "7.1.1 (NMF26F, Dec 2016. All carriers except Verizon)"
 # "14.0.0 (UD1A.230803.022.A3, Sep 2023, Verizon)"
 # "14.0.0 (UD1A.230803.022.A4, Sep 2023, US-Emerging/G-store,CA,TW,AU,Fi)"
+# The optional "Carrier, " prefix is written so each split of a run of letters is
+# only tried once; a nested (letters(,\s+)?)* loop backtracks exponentially on
+# version text that does not match.
 VERSION_PATTERN = re.compile(
-    r"(?:[a-z-]+(?:\s+[a-z-]+)*\s+)?(\d+\.\d+\.\d+)\s\((?:(?:[A-Za-z]+(?:,\s+)?)*)?([A-Z0-9]+\.?\d*\.?\d*[A-Z0-9]*)(?:,\s(\d{1,2}\s+)?(\w+\s\w+)(?:,\s[^)]+)?)?\)"
+    r"(?:[a-z-]+(?:\s+[a-z-]+)*\s+)?(\d+\.\d+\.\d+)\s\((?:[A-Za-z]+(?:,\s+[A-Za-z]+)*(?:,\s+)?)?([A-Z0-9]+\.?\d*\.?\d*[A-Z0-9]*)(?:,\s(\d{1,2}\s+)?(\w+\s\w+)(?:,\s[^)]+)?)?\)"
 )
 
+# The filename patterns below only ever see ASCII URLs, so they are compiled
+# with re.ASCII for cheaper character class tests. The version text patterns
+# stay Unicode-aware since table cells can contain non-ASCII whitespace.
+
 # Additional pattern for modern Pixel devices
 MODERN_PIXEL_PATTERN = re.compile(
-    r"([a-z]+)-ota-([a-z0-9]+)\.([0-9]+)\.([0-9]+)(?:\.([a-z0-9]+))?-"
+    r"([a-z]+)-ota-([a-z0-9]+)\.([0-9]+)\.([0-9]+)(?:\.([a-z0-9]+))?-",
+    re.ASCII
 )
 
 # Pattern for legacy builds (pre-Pixel era)
 LEGACY_BUILD_PATTERN = re.compile(
-    r"([a-z]+)-ota-([A-Z0-9]+)-([a-f0-9]+)\.zip"
+    r"([a-z]+)-ota-([A-Z0-9]+)-([a-f0-9]+)\.zip",
+    re.ASCII
 )
 
 # Pattern for factory images
 FACTORY_IMAGE_PATTERN = re.compile(
-    r"([a-z]+)-([a-z0-9]+\.\d+\.\d+\.?\d*[a-z0-9]*)-factory-[a-f0-9]+\.zip"
+    r"([a-z]+)-([a-z0-9]+\.\d+\.\d+\.?\d*[a-z0-9]*)-factory-[a-f0-9]+\.zip",
+    re.ASCII
+)
+
+# Pattern for download links; bs4 runs it directly instead of calling a
+# Python filter per anchor (".zip" is matched case-sensitively)
+ZIP_HREF_PATTERN = re.compile(
+    r"\.zip\Z"
+)
+
+# Pattern for the device codename in any OTA filename (e.g., "bullhead-ota-...")
+OTA_DEVICE_PATTERN = re.compile(
+    r"([a-z]+)-ota-",
+    re.ASCII
+)
+
+# Pattern for legacy version text with carrier (e.g., "4.4.2_r2 (Verizon) (KVT49L)")
+LEGACY_CARRIER_PATTERN = re.compile(
+    r"(\d+\.\d+(?:\.\d+)?(?:_r\d+)?)\s*\(([^)]+)\)\s*\(([A-Z0-9]+)\)"
 )
 
-@dataclass
+# Pattern for legacy version text (e.g., "4.3 (JWR66Y)" or "2.3.7 (GWK74)")
+LEGACY_PATTERN = re.compile(
+    r"(\d+\.\d+(?:\.\d+)?)\s*\(([A-Z0-9]+)\)"
+)
+
+def _combine_patterns(formats: Tuple[Tuple[str, re.Pattern], ...]) -> Tuple[re.Pattern, Dict[str, slice]]:
+    """
+    Join several patterns into one alternation of named groups.
+    
+    The alternatives are tried in the given order, so a single match() behaves
+    like calling each pattern's match() in turn. Returns the compiled pattern and,
+    for each name, the slice of match.groups() holding that pattern's own groups.
+    """
+    group_slices = {}
+    index = 0
+    for name, pattern in formats:
+        group_slices[name] = slice(index + 1, index + 1 + pattern.groups)
+        index += 1 + pattern.groups
+    flags = {pattern.flags for name, pattern in formats}
+    if len(flags) != 1:
+        raise ValueError("Combined patterns must be compiled with the same flags")
+    combined = re.compile("|".join(f"(?P<{name}>{pattern.pattern})" for name, pattern in formats), flags.pop())
+    return combined, group_slices
+
+# All version text formats in one pass: modern first, then the legacy fallbacks
+COMBINED_VERSION_PATTERN, COMBINED_VERSION_GROUPS = _combine_patterns((
+    ("modern", VERSION_PATTERN),
+    ("legacy_carrier", LEGACY_CARRIER_PATTERN),
+    ("legacy", LEGACY_PATTERN),
+))
+
+# All filename formats in one pass; a filename can match at most one of them
+FILENAME_PATTERN, FILENAME_GROUPS = _combine_patterns((
+    ("modern", MODERN_PIXEL_PATTERN),
+    ("factory", FACTORY_IMAGE_PATTERN),
+    ("legacy", LEGACY_BUILD_PATTERN),
+))
+
+# Pattern for the YYMMDD date embedded in build versions (e.g., "AP4A.250205.002")
+BUILD_DATE_PATTERN = re.compile(
+    r"\.(\d{6})\."
+)
+
+# Month abbreviations indexed by month number
+MONTH_ABBR = ('Unknown', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+              'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Characters allowed in a hex-encoded SHA256 digest
+HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+def _extract_sha256(checksum: str) -> Optional[str]:
+    """Return the leading 64 hex characters of checksum, or None if there aren't any."""
+    candidate = checksum[:64]
+    if len(candidate) == 64 and HEX_DIGITS.issuperset(candidate):
+        return candidate
+    return None
+
+# Carrier and region keywords mapped to display names, in priority order
+CARRIER_NAMES = {
+    "tmobile": "T-Mobile",
+    "t-mobile": "T-Mobile",
+    "verizon": "Verizon",
+    "att": "AT&T",
+    "at&t": "AT&T",
+    "sprint": "Sprint"
+}
+REGION_NAMES = {
+    "emea": "EMEA",
+    "india": "India",
+    "japan": "Japan",
+    "korea": "Korea",
+    "china": "China"
+}
+
+# Build type keywords in priority order (preview wins over qpr)
+BUILD_TYPE_NAMES = {
+    "preview": "preview",
+    "qpr": "qpr"
+}
+
+# Find every keyword occurrence in one scan; the lookahead keeps matches from
+# consuming text, so overlapping keywords (e.g. "at&tmobile") are all reported
+CARRIER_PATTERN = re.compile("(?=(" + "|".join(map(re.escape, CARRIER_NAMES)) + "))")
+REGION_PATTERN = re.compile("(?=(" + "|".join(map(re.escape, REGION_NAMES)) + "))")
+BUILD_TYPE_PATTERN = re.compile("(?=(" + "|".join(map(re.escape, BUILD_TYPE_NAMES)) + "))")
+
+def _find_keyword(pattern: re.Pattern, names: Dict[str, str], text: str) -> Optional[str]:
+    """Return the display name of the highest-priority keyword found in text."""
+    found = set(pattern.findall(text))
+    if not found:
+        return None
+    for keyword, name in names.items():
+        if keyword in found:
+            return name
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def _parse_version_text(text: str) -> Optional[Tuple]:
+    """Parse version text using regex pattern. Pure, so results are cached per string."""
+    # Every format has the build in parentheses; reject anything else
+    # without running the regex
+    if '(' not in text:
+        return None
+    
+    # Match the modern and both legacy formats in a single pass; the
+    # alternatives are tried in the same order as the individual patterns
+    match = COMBINED_VERSION_PATTERN.match(text)
+    if not match:
+        return None
+    
+    version_format = match.lastgroup
+    groups = match.groups()[COMBINED_VERSION_GROUPS[version_format]]
+    
+    if version_format == "modern":
+        # Make sure we have the expected number of groups even if some are None
+        if len(groups) >= 2:
+            android_version = groups[0]  # e.g., "15.0.0"
+            build_version = groups[1]    # e.g., "BP1A.250305.019"
+            
+            # Extract release date from build version if available
+            # Format: YYMMDD (e.g., 250305 for March 5th 2025)
+            release_date = "Unknown"
+            if len(build_version) >= 7:  # Ensure we have enough characters
+                try:
+                    # Look for the date pattern in the build version
+                    date_match = BUILD_DATE_PATTERN.search(build_version)
+                    if date_match:
+                        date_str = date_match.group(1)
+                        year = int(date_str[:2])
+                        month = int(date_str[2:4])
+                        day = int(date_str[4:6])
+                        
+                        # Convert month number to month name
+                        month_name = MONTH_ABBR[month] if 1 <= month <= 12 else 'Unknown'
+                        
+                        # Format the date with day
+                        release_date = f"{day} {month_name} 20{year}"
+                except (ValueError, IndexError):
+                    pass
+            
+            # If we couldn't get the date from build version, try the version text
+            if release_date == "Unknown":
+                # Now we have two groups for the date: day (optional) and month+year
+                day = groups[2] if groups[2] else None
+                # Sometimes the date isn't in the expected format or is missing
+                if day:
+                    release_date = f"{day} {groups[3]}" if groups[3] else "Unknown"
+                else:
+                    release_date = groups[3] if groups[3] else "Unknown"
+            
+            additional_info = groups[4] if len(groups) > 4 and groups[4] else None
+            
+            return (android_version, build_version, None, release_date, additional_info)
+    
+    # Legacy format with carrier (e.g., "4.4.2_r2 (Verizon) (KVT49L)")
+    if version_format == "legacy_carrier":
+        android_version, carrier, build_version = groups
+        return (android_version, build_version, None, "Unknown", carrier)
+    
+    # Legacy format (e.g., "4.3 (JWR66Y)" or "2.3.7 (GWK74)")
+    if version_format == "legacy":
+        android_version, build_version = groups
+        return (android_version, build_version, None, "Unknown", None)
+    
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def _classify_filename(filename: str) -> Tuple[Optional[str], Optional[Tuple]]:
+    """
+    Match filename against every known filename format at once.
+    
+    Returns:
+        Tuple of the format name ("modern", "factory" or "legacy") and that
+        format's match groups, or (None, None) if nothing matched
+    """
+    match = FILENAME_PATTERN.match(filename)
+    if not match:
+        return None, None
+    return match.lastgroup, match.groups()[FILENAME_GROUPS[match.lastgroup]]
+
+# Sentinel for build prefixes that need legacy version text parsing
+LEGACY_BUILD = object()
+
+# Android version by build prefix; anything not listed falls back to 13.0.0
+PREFIX_TO_VERSION = MappingProxyType({
+    'OPR': LEGACY_BUILD,  # Legacy devices (like Nexus Player)
+    'AP4': "15.0.0",
+    'AP3': "14.0.0",
+    'AP2': "14.0.0",
+    'BP': "15.0.0",
+})
+
+@functools.lru_cache(maxsize=4096)
+def _parse_modern_pixel_filename(filename: str) -> Optional[Tuple]:
+    """
+    Parse modern Pixel device filenames (e.g., husky-ota-bp1a.250305.019-b4977f37.zip).
+    
+    The release date is left as "Unknown"; the scraper fills it in from the
+    table row the link came from.
+    """
+    filename_format, groups = _classify_filename(filename)
+    if filename_format != "modern":
+        return None
+    
+    if len(groups) >= 4:
+        device = groups[0]
+        build_prefix = groups[1].upper()
+        build_major = groups[2]
+        build_minor = groups[3]
+        build_variant = groups[4] if groups[4] else None
+        
+        # Determine Android version based on build prefix (three-letter
+        # prefixes take precedence over two-letter ones)
+        android_version = PREFIX_TO_VERSION.get(build_prefix[:3]) or PREFIX_TO_VERSION.get(build_prefix[:2], "13.0.0")
+        if android_version is LEGACY_BUILD:
+            # This is a legacy device build (like Nexus Player); return None to
+            # force legacy format parsing of the version from the parent row
+            return None
+        
+        build_version = f"{build_prefix}{build_major}.{build_minor}"
+        if build_variant:
+            build_version += f".{build_variant}"
+        
+        return (android_version, build_version, None, "Unknown", None)
+    
+    return None
+
+# Sort priorities for build variant letters and build types
+VARIANT_PRIORITY = {'a': 1, 'b': 2, 'c': 3, 'd': 4}
+BUILD_TYPE_PRIORITY = {
+    "stable": 0,
+    "qpr": 1,
+    "preview": 2,
+    "beta": 3
+}
+
+# slots=True drops the per-instance __dict__, which is only supported on Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**DATACLASS_SLOTS)
 class AndroidImageInfo:
     """Class to store Android image information (OTA or factory)"""
     device: str  # Add device field
@@ -137,13 +478,18 @@ class AndroidImageInfo:
     security_patch_level: Optional[str] = field(default=None)
     friendly_name: Optional[str] = field(default=None)  # Added friendly name field
     checksum: Optional[str] = field(default=None)  # Added checksum field
+    _sort_key: Optional[Tuple] = field(init=False, repr=False, compare=False, default=None)
 
     def __post_init__(self):
-        self.filename = self.download_url.split("/")[-1]
+        self.filename = self.download_url.rpartition("/")[2]
         # Enhanced image type detection
         self._detect_image_type()
+        # Split the build version once for the patch level and the sort key
+        build_parts = self.build_version.split('.')
         # Extract security patch level from build version
-        self._extract_security_patch()
+        self._extract_security_patch(build_parts)
+        # Precompute the version sort key (needs the detected build type)
+        self._sort_key = self._compute_sort_key(build_parts)
     
     def _detect_image_type(self):
         """Detect various image types and properties from filename and additional info"""
@@ -152,84 +498,260 @@ class AndroidImageInfo:
         
         # Basic type detection
         self.is_beta = "beta" in filename_lower or ".b" in self.build_version.lower()
-        self.is_carrier = any(carrier in filename_lower or carrier in info_lower 
-                            for carrier in ["tmobile", "verizon", "att", "sprint", "t-mobile", "at&t"])
         self.is_factory = "factory" in filename_lower
-        self.is_region_specific = any(region in info_lower 
-                                    for region in ["emea", "india", "japan", "korea", "china"])
-        
-        # Extract carrier information
-        carrier_map = {
-            "tmobile": "T-Mobile",
-            "t-mobile": "T-Mobile",
-            "verizon": "Verizon",
-            "att": "AT&T",
-            "at&t": "AT&T",
-            "sprint": "Sprint"
-        }
-        for carrier_key, carrier_name in carrier_map.items():
-            if carrier_key in filename_lower or carrier_key in info_lower:
-                self.carrier = carrier_name
-                break
-        
-        # Extract region information
-        region_map = {
-            "emea": "EMEA",
-            "india": "India",
-            "japan": "Japan",
-            "korea": "Korea",
-            "china": "China"
-        }
-        for region_key, region_name in region_map.items():
-            if region_key in info_lower:
-                self.region = region_name
-                break
         
-        # Determine build type
+        # Extract carrier and region information, scanning each field once
+        combined_lower = f"{filename_lower}|{info_lower}"
+        carrier = _find_keyword(CARRIER_PATTERN, CARRIER_NAMES, combined_lower)
+        self.is_carrier = carrier is not None
+        if carrier:
+            self.carrier = carrier
+        
+        region = _find_keyword(REGION_PATTERN, REGION_NAMES, info_lower)
+        self.is_region_specific = region is not None
+        if region:
+            self.region = region
+        
+        # Determine build type, looking for preview and qpr in one scan
         if self.is_beta:
             self.build_type = "beta"
-        elif "preview" in filename_lower or "preview" in info_lower:
-            self.build_type = "preview"
-        elif "qpr" in filename_lower or "qpr" in info_lower:
-            self.build_type = "qpr"
         else:
-            self.build_type = "stable"
+            self.build_type = _find_keyword(BUILD_TYPE_PATTERN, BUILD_TYPE_NAMES, combined_lower) or "stable"
     
-    def _extract_security_patch(self):
-        """Extract security patch level from build version"""
+    def _extract_security_patch(self, build_parts: List[str]):
+        """Extract security patch level from the dot-separated build version parts"""
         # Build version format: AP4A.250205.002
         # Security patch is in the second part (250205)
-        parts = self.build_version.split('.')
-        if len(parts) >= 2:
-            patch = parts[1]
+        if len(build_parts) >= 2:
+            patch = build_parts[1]
             if len(patch) == 6:
                 year = patch[:2]
                 month = patch[2:4]
                 self.security_patch_level = f"20{year}-{month}"
     
+    def _compute_sort_key(self, build_parts: List[str]) -> Tuple:
+        """Build the key used by VERSION_SORT_KEY and AndroidImageScraper.get_version_sort_key."""
+        # Extract the major Android version (e.g., 14.0.0 -> 14); the key is built
+        # while constructing the image, so unparseable versions sort last instead
+        # of failing the whole parse
+        try:
+            android_major = float(self.android_version.partition('.')[0])
+        except ValueError:
+            android_major = 0.0
+        
+        # Extract base build version and variant
+        base_build = '.'.join(build_parts[:3])  # e.g., AP4A.250205.002
+        
+        # Determine if there's a variant code (like b1, a2, etc.)
+        variant_priority = 0
+        variant_number = 0
+        
+        if len(build_parts) > 3:
+            variant = build_parts[3]
+            # Set priority based on variant letter (a < b < c < d)
+            variant_priority = VARIANT_PRIORITY.get(variant[:1], 0)
+                
+            # Extract variant number if present
+            if len(variant) > 1 and variant[1:].isdigit():
+                variant_number = int(variant[1:])
+        
+        # Sort by:
+        # 1. Android major version (e.g., 15, 14)
+        # 2. Base build version (e.g., AP4A.250205.002)
+        # 3. Build type priority (stable > qpr > preview > beta)
+        # 4. Variant priority (a < b < c < d)
+        # 5. Variant number (1, 2, 3, etc.)
+        # 6. Image type (stable > carrier > region-specific)
+        build_type_priority = BUILD_TYPE_PRIORITY.get(self.build_type, 4)  # Default to lowest priority
+        
+        image_type_priority = 0
+        if self.is_carrier:
+            image_type_priority = 1
+        elif self.is_region_specific:
+            image_type_priority = 2
+            
+        return (android_major, base_build, build_type_priority, variant_priority, variant_number, image_type_priority)
+    
     def to_dict(self) -> Dict:
         """Convert the object to a dictionary for JSON output"""
-        return {
-            "device": self.device,
+        return dict(zip(IMAGE_DICT_FIELDS, IMAGE_DICT_VALUES(self)))
+    
+    def to_output_dict(self, device: str, is_factory: bool = False) -> Dict:
+        """
+        Convert the object to the compact dictionary printed by --device --json.
+        
+        Args:
+            device: Device codename that was requested
+            is_factory: Whether a factory image was requested
+            
+        Returns:
+            Dict of the output fields, leaving out those that are None
+        """
+        output = {
+            "device": device,
             "android_version": self.android_version,
             "build_version": self.build_version,
-            "sub_version": self.sub_version,
             "release_date": self.release_date,
-            "additional_info": self.additional_info,
             "download_url": self.download_url,
             "filename": self.filename,
-            "last_checked": self.last_checked,
-            "is_beta": self.is_beta,
-            "is_carrier": self.is_carrier,
-            "is_factory": self.is_factory,
-            "is_region_specific": self.is_region_specific,
-            "region": self.region,
-            "carrier": self.carrier,
-            "build_type": self.build_type,
+            "checksum": self.checksum,
             "security_patch_level": self.security_patch_level,
-            "friendly_name": self.friendly_name,
-            "checksum": self.checksum
+            "carrier": self.carrier,
+            "region": self.region,
+            "is_factory": is_factory
         }
+        return {k: v for k, v in output.items() if v is not None}
+
+
+# Sort key for AndroidImageInfo lists; fetches the precomputed key in C
+VERSION_SORT_KEY = operator.attrgetter('_sort_key')
+
+# Public AndroidImageInfo fields written by to_dict, in declaration order, and
+# a getter that fetches all of their values in one C call
+IMAGE_DICT_FIELDS = tuple(f.name for f in fields(AndroidImageInfo) if not f.name.startswith('_'))
+IMAGE_DICT_VALUES = operator.attrgetter(*IMAGE_DICT_FIELDS)
+
+# AndroidImageInfo fields accepted by the constructor; to_dict also writes
+# derived ones such as filename, which have to be dropped when loading
+IMAGE_INIT_FIELDS = frozenset(f.name for f in fields(AndroidImageInfo) if f.init)
+
+# Fields every data cache entry must have
+CACHE_REQUIRED_FIELDS = frozenset({
+    'device', 'android_version', 'build_version',
+    'release_date', 'download_url', 'filename',
+    'last_checked'
+})
+
+# Data cache fields whose values repeat heavily across entries; derived
+# fields are left out since __post_init__ recomputes them anyway
+CACHE_INTERNED_FIELDS = (
+    'device', 'android_version', 'release_date', 'friendly_name'
+)
+
+# Bump when parse_page output changes so stale parse caches are ignored
+PARSE_CACHE_VERSION = 2
+
+# AndroidImageInfo constructor arguments stored per image in the parse cache;
+# everything else is derived again when the image is rebuilt
+PARSE_CACHE_FIELDS = (
+    'device', 'android_version', 'build_version', 'sub_version', 'release_date',
+    'additional_info', 'download_url', 'checksum', 'is_factory'
+)
+PARSE_CACHE_VALUES = operator.attrgetter(*PARSE_CACHE_FIELDS)
+
+# Number of parsed pages kept in the parse cache directory
+PARSE_CACHE_MAX_FILES = 3
+
+# 1 MB chunks buffered between the download thread and each writer/hasher thread
+DOWNLOAD_QUEUE_SIZE = 8
+
+# Byte-range parts fetched in parallel for large downloads, and the smallest
+# part worth a separate connection
+DOWNLOAD_PARALLEL_PARTS = 4
+DOWNLOAD_MIN_PART_SIZE = 8 * 1024 * 1024
+
+# Pooled connections kept per host for file downloads
+DOWNLOAD_POOL_SIZE = 16
+
+# Seconds to wait for a download connection, and for data once connected, so
+# a stalled transfer fails instead of hanging (and blocking part cleanup)
+DOWNLOAD_TIMEOUT = (10, 60)
+
+# Files at least this large are hashed through a read-only memory map
+MMAP_HASH_MIN_SIZE = 64 * 1024 * 1024
+
+# Minimum seconds between progress line redraws (about 30 per second)
+PROGRESS_REDRAW_INTERVAL = 1 / 30
+
+# Sidecar file remembering the SHA256 of files already hashed, keyed by path;
+# kept next to this script rather than in whatever directory it was run from
+HASH_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hashcache.json")
+
+# Device friendly names mapping
+DEVICE_NAMES = MappingProxyType({
+    # Pixel 9 series
+    'comet': 'Pixel 9 Pro Fold',
+    'caiman': 'Pixel 9 Pro',
+    'komodo': 'Pixel 9 Pro XL',
+    'tokay': 'Pixel 9',
+    
+    # Pixel 8 series
+    'husky': 'Pixel 8 Pro',
+    'shiba': 'Pixel 8',
+    'akita': 'Pixel 8a',
+    
+    # Pixel 7 series
+    'cheetah': 'Pixel 7 Pro',
+    'panther': 'Pixel 7',
+    'lynx': 'Pixel 7a',
+    
+    # Pixel 6 series
+    'raven': 'Pixel 6 Pro',
+    'oriole': 'Pixel 6',
+    'bluejay': 'Pixel 6a',
+    
+    # Pixel 5 series
+    'redfin': 'Pixel 5',
+    'barbet': 'Pixel 5a',
+    
+    # Pixel 4 series
+    'coral': 'Pixel 4 XL',
+    'flame': 'Pixel 4',
+    'sunfish': 'Pixel 4a',
+    'bramble': 'Pixel 4a 5G',
+    
+    # Pixel 3 series
+    'crosshatch': 'Pixel 3 XL',
+    'blueline': 'Pixel 3',
+    'sargo': 'Pixel 3a XL',
+    'bonito': 'Pixel 3a',
+    
+    # Pixel 2 series
+    'taimen': 'Pixel 2 XL',
+    'walleye': 'Pixel 2',
+    
+    # Pixel 1 series
+    'marlin': 'Pixel XL',
+    'sailfish': 'Pixel',
+    
+    # Special devices
+    'felix': 'Pixel Fold',
+    'tangorpro': 'Pixel Tablet',
+    
+    # Legacy devices
+    'fugu': 'Nexus Player',
+    'volantis': 'Nexus 9',
+    'volantisg': 'Nexus 9 LTE',
+    'razor': 'Nexus 6',
+    'razorg': 'Nexus 6',
+    'shamu': 'Nexus 6',
+    'hammerhead': 'Nexus 5',
+    'bullhead': 'Nexus 5X',
+    'angler': 'Nexus 6P',
+    'ryu': 'Nexus 6P'
+})
+
+# Device family mapping
+DEVICE_FAMILIES = MappingProxyType({
+    'pixel9': ['comet', 'caiman', 'komodo', 'tokay'],  # Pixel 9 Pro Fold, Pro, Pro XL, and base
+    'pixel8': ['husky', 'shiba', 'akita'],  # Pixel 8 Pro, base, and 8a
+    'pixel7': ['cheetah', 'panther', 'lynx'],  # Pixel 7 Pro, base, and 7a
+    'pixel6': ['raven', 'oriole', 'bluejay'],  # Pixel 6 Pro, base, and 6a
+    'pixel5': ['redfin', 'barbet'],  # Pixel 5 and 5a
+    'pixel4': ['coral', 'flame', 'sunfish', 'bramble'],  # Pixel 4 XL, base, 4a, and 4a 5G
+    'pixel3': ['crosshatch', 'blueline', 'sargo', 'bonito'],  # Pixel 3 XL, base, 3a XL, and 3a
+    'pixel2': ['taimen', 'walleye'],  # Pixel 2 XL and base
+    'pixel1': ['marlin', 'sailfish'],  # Pixel XL and base
+    'pixel_fold': ['felix'],  # Pixel Fold
+    'pixel_tablet': ['tangorpro']  # Pixel Tablet Pro
+})
+
+# Reverse mapping for quick lookup
+DEVICE_TO_FAMILY = MappingProxyType({
+    device: family
+    for family, devices in DEVICE_FAMILIES.items()
+    for device in devices
+})
 
 
 class AndroidImageScraper:
@@ -241,7 +763,10 @@ class AndroidImageScraper:
                  cache_max_age_days: int = 1,
                  max_retries: int = 3,
                  retry_delay: float = 1.0,
-                 rate_limit_delay: float = 2.0):
+                 rate_limit_delay: float = 2.0,
+                 max_concurrency: int = 4,
+                 parse_cache_dir: Optional[str] = None,
+                 revalidate: bool = False):
         """
         Initialize the Android image scraper.
         
@@ -254,16 +779,24 @@ class AndroidImageScraper:
             max_retries: Maximum number of retry attempts for failed requests
             retry_delay: Delay between retry attempts in seconds
             rate_limit_delay: Delay between successful requests in seconds
+            max_concurrency: Maximum number of devices looked up in parallel
+            parse_cache_dir: Directory for parsed page results, reused while the page is unchanged;
+                defaults to a parse_cache directory next to cache_file
+            revalidate: Check each cached page with Google once on its first use,
+                even if the cache entry has not expired yet
         """
         self.url = url
         self.factory_url = factory_url
         self.cache_file = cache_file
         self.factory_cache_file = factory_cache_file
+        self.parse_cache_dir = parse_cache_dir or os.path.join(os.path.dirname(os.path.abspath(cache_file)), "parse_cache")
         self.cache_max_age_days = cache_max_age_days
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.rate_limit_delay = rate_limit_delay
+        self.max_concurrency = max(1, max_concurrency)
         self.last_request_time = 0
+        self._rate_limit_lock = threading.Lock()
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
@@ -279,92 +812,37 @@ class AndroidImageScraper:
         }
         self.cookies = SimpleCookie()
         self.cookies["devsite_wall_acks"] = "nexus-image-tos,nexus-ota-tos"  # Combined TOS acknowledgments
-        self.checksums = {}  # Cache for checksums
-        
-        # Device friendly names mapping
-        self.device_names = {
-            # Pixel 9 series
-            'comet': 'Pixel 9 Pro Fold',
-            'caiman': 'Pixel 9 Pro',
-            'komodo': 'Pixel 9 Pro XL',
-            'tokay': 'Pixel 9',
-            
-            # Pixel 8 series
-            'husky': 'Pixel 8 Pro',
-            'shiba': 'Pixel 8',
-            'akita': 'Pixel 8a',
-            
-            # Pixel 7 series
-            'cheetah': 'Pixel 7 Pro',
-            'panther': 'Pixel 7',
-            'lynx': 'Pixel 7a',
-            
-            # Pixel 6 series
-            'raven': 'Pixel 6 Pro',
-            'oriole': 'Pixel 6',
-            'bluejay': 'Pixel 6a',
-            
-            # Pixel 5 series
-            'redfin': 'Pixel 5',
-            'barbet': 'Pixel 5a',
-            
-            # Pixel 4 series
-            'coral': 'Pixel 4 XL',
-            'flame': 'Pixel 4',
-            'sunfish': 'Pixel 4a',
-            'bramble': 'Pixel 4a 5G',
-            
-            # Pixel 3 series
-            'crosshatch': 'Pixel 3 XL',
-            'blueline': 'Pixel 3',
-            'sargo': 'Pixel 3a XL',
-            'bonito': 'Pixel 3a',
-            
-            # Pixel 2 series
-            'taimen': 'Pixel 2 XL',
-            'walleye': 'Pixel 2',
-            
-            # Pixel 1 series
-            'marlin': 'Pixel XL',
-            'sailfish': 'Pixel',
-            
-            # Special devices
-            'felix': 'Pixel Fold',
-            'tangorpro': 'Pixel Tablet',
-            
-            # Legacy devices
-            'fugu': 'Nexus Player',
-            'volantis': 'Nexus 9',
-            'volantisg': 'Nexus 9 LTE',
-            'razor': 'Nexus 6',
-            'razorg': 'Nexus 6',
-            'shamu': 'Nexus 6',
-            'hammerhead': 'Nexus 5',
-            'bullhead': 'Nexus 5X',
-            'angler': 'Nexus 6P',
-            'ryu': 'Nexus 6P'
-        }
         
-        # Device family mapping
-        self.device_families = {
-            'pixel9': ['comet', 'caiman', 'komodo', 'tokay'],  # Pixel 9 Pro Fold, Pro, Pro XL, and base
-            'pixel8': ['husky', 'shiba', 'akita'],  # Pixel 8 Pro, base, and 8a
-            'pixel7': ['cheetah', 'panther', 'lynx'],  # Pixel 7 Pro, base, and 7a
-            'pixel6': ['raven', 'oriole', 'bluejay'],  # Pixel 6 Pro, base, and 6a
-            'pixel5': ['redfin', 'barbet'],  # Pixel 5 and 5a
-            'pixel4': ['coral', 'flame', 'sunfish', 'bramble'],  # Pixel 4 XL, base, 4a, and 4a 5G
-            'pixel3': ['crosshatch', 'blueline', 'sargo', 'bonito'],  # Pixel 3 XL, base, 3a XL, and 3a
-            'pixel2': ['taimen', 'walleye'],  # Pixel 2 XL and base
-            'pixel1': ['marlin', 'sailfish'],  # Pixel XL and base
-            'pixel_fold': ['felix'],  # Pixel Fold
-            'pixel_tablet': ['tangorpro']  # Pixel Tablet Pro
-        }
-        
-        # Reverse mapping for quick lookup
-        self.device_to_family = {}
-        for family, devices in self.device_families.items():
-            for device in devices:
-                self.device_to_family[device] = family
+        # Reuse one keep-alive session for every request instead of a new
+        # TCP+TLS handshake per page; the pool covers concurrent fetches
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.cookies.update(self.get_cookie_dict())
+        adapter = requests.adapters.HTTPAdapter(pool_connections=self.max_concurrency, pool_maxsize=self.max_concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.checksums = {}  # Cache for checksums
+        self._soup_cache = {}  # Parsed pages keyed by content digest
+        self._soup_lock = threading.Lock()
+        self._parsed_pages = {}  # Last (time, html, parse result) per page type
+        self._parsed_pages_lock = threading.Lock()
+        # Page types (False for OTA, True for factory) still to be revalidated
+        self._pending_revalidation = {False, True} if revalidate else set()
+        
+        # Device lookup tables are shared, read-only module constants
+        self.device_names = DEVICE_NAMES
+        self.device_families = DEVICE_FAMILIES
+        self.device_to_family = DEVICE_TO_FAMILY
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+    
+    def __enter__(self) -> "AndroidImageScraper":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def get_device_family(self, device_codename: str) -> Optional[str]:
         """Get the family name for a device codename."""
@@ -372,7 +850,11 @@ class AndroidImageScraper:
     
     def get_family_devices(self, family_name: str) -> List[str]:
         """Get all devices in a family."""
-        return self.device_families.get(family_name, [])
+        return list(self.device_families.get(family_name, []))
+    
+    def get_all_devices(self) -> List[str]:
+        """Get the codenames of all supported devices."""
+        return list(self.device_names)
     
     def get_latest_ota_for_family(self, family_name: str, **kwargs) -> Dict[str, Optional[AndroidImageInfo]]:
         """
@@ -389,10 +871,30 @@ class AndroidImageScraper:
         if not devices:
             logger.error(f"No devices found in family: {family_name}")
             return {}
+        
+        return self.get_latest_ota_for_devices(devices, **kwargs)
+    
+    def get_latest_ota_for_devices(self, devices: List[str], **kwargs) -> Dict[str, Optional[AndroidImageInfo]]:
+        """
+        Get the latest OTA for several devices concurrently.
+        
+        Args:
+            devices: Device codenames to check
+            **kwargs: Additional arguments to pass to get_latest_ota
             
-        results = {}
-        for device in devices:
-            results[device] = self.get_latest_ota(device, **kwargs)
+        Returns:
+            Dict mapping device codenames to their latest OTA info, in the order given
+        """
+        if not devices:
+            return {}
+        
+        # Fetch and parse the page once up front so the workers below share it
+        self.get_parsed_page()
+        
+        # Each lookup is independent, so overlap them instead of running serially
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(devices))) as executor:
+            latest = executor.map(lambda device: self.get_latest_ota(device, **kwargs), devices)
+            results = dict(zip(devices, latest))
             
         return results
     
@@ -402,73 +904,186 @@ class AndroidImageScraper:
             "devsite_wall_acks": "nexus-image-tos,nexus-ota-tos"
         }
         
-    def save_page_cache(self, html_content: str, is_factory: bool = False) -> None:
-        """Save the page content to cache file."""
+    def get_page_cache_file(self, is_factory: bool = False) -> str:
+        """Return the path of the compressed page cache for the OTA or factory page."""
+        return (self.factory_cache_file if is_factory else self.cache_file) + '.gz'
+    
+    def save_page_cache(self, html_content: str, is_factory: bool = False,
+                        etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Save the page content to a gzip-compressed cache file.
+        
+        Args:
+            html_content: Page HTML to cache
+            is_factory: Whether this is the factory images page
+            etag: ETag response header, used to revalidate the page once the cache expires
+            last_modified: Last-Modified response header, used the same way
+        """
         try:
-            cache_file = self.factory_cache_file if is_factory else self.cache_file
+            cache_file = self.get_page_cache_file(is_factory)
             cache_data = {
                 'timestamp': time.time(),
-                'content': html_content
+                'content': html_content,
+                'etag': etag,
+                'last_modified': last_modified
             }
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f)
+            _atomic_write_bytes(cache_file, gzip.compress(_json_dumps(cache_data), compresslevel=3))
             logger.debug(f"Page content cached successfully to {cache_file}")
         except Exception as e:
             logger.error(f"Failed to save page cache: {e}")
 
+    def read_page_cache(self, is_factory: bool = False) -> Optional[Dict]:
+        """Read the raw page cache entry, expired or not."""
+        cache_file = self.get_page_cache_file(is_factory)
+        if os.path.exists(cache_file):
+            with gzip.open(cache_file, 'rb') as f:
+                return _json_loads(f.read())
+        
+        # Fall back to an uncompressed cache written by older versions; the same
+        # path may instead hold the image data cache, which is not a page entry
+        cache_file = self.factory_cache_file if is_factory else self.cache_file
+        if not os.path.exists(cache_file):
+            return None
+        
+        with open(cache_file, 'rb') as f:
+            cache_data = _json_loads(f.read())
+        if isinstance(cache_data, dict) and 'timestamp' in cache_data and 'content' in cache_data:
+            return cache_data
+        return None
+
     def load_page_cache(self, is_factory: bool = False) -> Optional[str]:
         """Load the page content from cache if it exists and is not expired."""
         try:
-            cache_file = self.factory_cache_file if is_factory else self.cache_file
-            if not os.path.exists(cache_file):
+            cache_data = self.read_page_cache(is_factory)
+            if cache_data is None:
                 return None
             
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
             # Check if cache is expired
             if time.time() - cache_data['timestamp'] > self.cache_max_age_days * 24 * 3600:
-                logger.debug(f"Cache expired for {cache_file}")
+                logger.debug(f"Cache expired for {'factory' if is_factory else 'OTA'} page")
                 return None
             
-            logger.debug(f"Using cached page content from {cache_file}")
+            logger.debug(f"Using cached {'factory' if is_factory else 'OTA'} page content")
             return cache_data['content']
         except Exception as e:
             logger.error(f"Failed to load page cache: {e}")
             return None
 
-    def fetch_page(self, url: Optional[str] = None, is_factory: bool = False) -> Optional[str]:
-        """Fetch the page HTML content with rate limiting and retries."""
+    def get_parse_cache_file(self, html: str, is_factory: bool = False) -> str:
+        """Return the parse cache path for this exact page content."""
+        digest = hashlib.sha256(html.encode('utf-8')).hexdigest()[:16]
+        kind = "factory" if is_factory else "ota"
+        return os.path.join(self.parse_cache_dir, f"parsed_v{PARSE_CACHE_VERSION}_{kind}_{digest}.json")
+    
+    def load_parse_cache(self, html: str, is_factory: bool = False) -> Optional[Dict[str, List[AndroidImageInfo]]]:
+        """
+        Load previously parsed results for this page, if any.
+        
+        The images are rebuilt from their stored constructor arguments, so
+        derived fields and last_checked are fresh for this run.
+        """
+        cache_file = self.get_parse_cache_file(html, is_factory)
+        if not os.path.exists(cache_file):
+            return None
+        try:
+            with open(cache_file, 'rb') as f:
+                cache_data = _json_loads(f.read())
+            result = {
+                device: [AndroidImageInfo(**dict(zip(PARSE_CACHE_FIELDS, values))) for values in entries]
+                for device, entries in cache_data.items()
+            }
+            # Mark as recently used so eviction keeps it
+            os.utime(cache_file)
+            logger.debug(f"Using parsed page from {cache_file}")
+            return result
+        except Exception as e:
+            logger.warning(f"Failed to load parse cache {cache_file}: {e}")
+            return None
+    
+    def save_parse_cache(self, html: str, is_factory: bool, result: Dict[str, List[AndroidImageInfo]]) -> None:
+        """Save parsed results for this page and evict the least recently used entries."""
+        try:
+            os.makedirs(self.parse_cache_dir, exist_ok=True)
+            cache_file = self.get_parse_cache_file(html, is_factory)
+            cache_data = {
+                device: [PARSE_CACHE_VALUES(image) for image in images]
+                for device, images in result.items()
+            }
+            _atomic_write_bytes(cache_file, _json_dumps(cache_data))
+            
+            # Keep only the most recently used parse cache files
+            cache_files = [
+                os.path.join(self.parse_cache_dir, name)
+                for name in os.listdir(self.parse_cache_dir)
+                if name.startswith("parsed_") and name.endswith(".json")
+            ]
+            cache_files.sort(key=os.path.getmtime, reverse=True)
+            for old_file in cache_files[PARSE_CACHE_MAX_FILES:]:
+                os.remove(old_file)
+        except Exception as e:
+            logger.error(f"Failed to save parse cache: {e}")
+
+    def fetch_page(self, url: Optional[str] = None, is_factory: bool = False,
+                   revalidate: bool = False) -> Optional[str]:
+        """
+        Fetch the page HTML content with rate limiting and retries.
+        
+        Args:
+            url: URL to fetch; defaults to the OTA or factory page URL
+            is_factory: Whether this is the factory images page
+            revalidate: Check a cached page with a conditional request even if
+                it has not expired yet
+            
+        Returns:
+            Page HTML, or None if it couldn't be fetched
+        """
         # Use provided URL or default to appropriate URL based on type
         target_url = url or (self.factory_url if is_factory else self.url)
         
         # Try to load from cache first
-        cached_content = self.load_page_cache(is_factory)
-        if cached_content:
-            return cached_content
+        if not revalidate:
+            cached_content = self.load_page_cache(is_factory)
+            if cached_content:
+                return cached_content
 
-        current_time = time.time()
-        
-        # Rate limiting
-        time_since_last_request = current_time - self.last_request_time
-        if time_since_last_request < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - time_since_last_request)
+        # An expired cache entry can still be revalidated with a conditional
+        # request, which skips the download when the page hasn't changed
+        conditional_headers = {}
+        try:
+            stale_cache = self.read_page_cache(is_factory)
+        except Exception:
+            stale_cache = None
+        if stale_cache and stale_cache.get('content'):
+            if stale_cache.get('etag'):
+                conditional_headers['If-None-Match'] = stale_cache['etag']
+            if stale_cache.get('last_modified'):
+                conditional_headers['If-Modified-Since'] = stale_cache['last_modified']
+        
+        # Rate limiting (serialized so concurrent fetches stay spaced apart)
+        self._wait_for_rate_limit()
         
         for attempt in range(self.max_retries):
             try:
                 logger.debug(f"Fetching page from {target_url}")
-                response = requests.get(
-                    target_url, 
-                    headers=self.headers, 
-                    cookies=self.get_cookie_dict(),
-                    timeout=30
-                )
+                response = self.session.get(target_url, headers=conditional_headers, timeout=30)
                 response.raise_for_status()
-                self.last_request_time = time.time()
                 
-                # Save to appropriate cache
-                self.save_page_cache(response.text, is_factory)
-                return response.text
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                if response.status_code == 304 and conditional_headers:
+                    logger.debug(f"Page not modified since last fetch: {target_url}")
+                    html = stale_cache['content']
+                    # A 304 may omit validators; keep the ones we already have
+                    etag = etag or stale_cache.get('etag')
+                    last_modified = last_modified or stale_cache.get('last_modified')
+                else:
+                    # Decode once with the declared charset; response.text runs charset
+                    # detection over the whole multi-MB page when none is declared
+                    html = response.content.decode(response.encoding or 'utf-8', errors='replace')
+                
+                # Save to appropriate cache (this also renews a revalidated entry)
+                self.save_page_cache(html, is_factory, etag=etag, last_modified=last_modified)
+                return html
                 
             except requests.exceptions.RequestException as e:
                 logger.error(f"Request failed (attempt {attempt + 1}/{self.max_retries}): {e}")
@@ -478,131 +1093,42 @@ class AndroidImageScraper:
                     logger.error("Max retries reached, giving up")
                     return None
     
+    def _wait_for_rate_limit(self) -> None:
+        """Block until rate_limit_delay has passed since the previous request started."""
+        with self._rate_limit_lock:
+            time_since_last_request = time.time() - self.last_request_time
+            if time_since_last_request < self.rate_limit_delay:
+                time.sleep(self.rate_limit_delay - time_since_last_request)
+            self.last_request_time = time.time()
+    
     def parse_version_text(self, text: str) -> Tuple:
         """Parse version text using regex pattern."""
-        # First try the modern format
-        match = VERSION_PATTERN.match(text)
-        if match:
-            groups = match.groups()
-            # Make sure we have the expected number of groups even if some are None
-            if len(groups) >= 2:
-                android_version = groups[0]  # e.g., "15.0.0"
-                build_version = groups[1]    # e.g., "BP1A.250305.019"
-                
-                # Extract release date from build version if available
-                # Format: YYMMDD (e.g., 250305 for March 5th 2025)
-                release_date = "Unknown"
-                if len(build_version) >= 7:  # Ensure we have enough characters
-                    try:
-                        # Look for the date pattern in the build version
-                        date_match = re.search(r'\.(\d{6})\.', build_version)
-                        if date_match:
-                            date_str = date_match.group(1)
-                            year = int(date_str[:2])
-                            month = int(date_str[2:4])
-                            day = int(date_str[4:6])
-                            
-                            # Convert month number to month name
-                            month_names = {
-                                1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr',
-                                5: 'May', 6: 'Jun', 7: 'Jul', 8: 'Aug',
-                                9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'
-                            }
-                            month_name = month_names.get(month, 'Unknown')
-                            
-                            # Format the date with day
-                            release_date = f"{day} {month_name} 20{year}"
-                    except (ValueError, IndexError):
-                        pass
-                
-                # If we couldn't get the date from build version, try the version text
-                if release_date == "Unknown":
-                    # Now we have two groups for the date: day (optional) and month+year
-                    day = groups[2] if groups[2] else None
-                    # Sometimes the date isn't in the expected format or is missing
-                    if day:
-                        release_date = f"{day} {groups[3]}" if groups[3] else "Unknown"
-                    else:
-                        release_date = groups[3] if groups[3] else "Unknown"
-                
-                additional_info = groups[4] if len(groups) > 4 and groups[4] else None
-                
-                return (android_version, build_version, None, release_date, additional_info)
-        
-        # Try legacy format with carrier (e.g., "4.4.2_r2 (Verizon) (KVT49L)")
-        legacy_carrier_match = re.match(r'(\d+\.\d+(?:\.\d+)?(?:_r\d+)?)\s*\(([^)]+)\)\s*\(([A-Z0-9]+)\)', text)
-        if legacy_carrier_match:
-            android_version = legacy_carrier_match.group(1)
-            carrier = legacy_carrier_match.group(2)
-            build_version = legacy_carrier_match.group(3)
-            return (android_version, build_version, None, "Unknown", carrier)
-        
-        # Try legacy format (e.g., "4.3 (JWR66Y)" or "2.3.7 (GWK74)")
-        legacy_match = re.match(r'(\d+\.\d+(?:\.\d+)?)\s*\(([A-Z0-9]+)\)', text)
-        if legacy_match:
-            android_version = legacy_match.group(1)
-            build_version = legacy_match.group(2)
-            return (android_version, build_version, None, "Unknown", None)
-        
-        return None
+        return _parse_version_text(text)
     
     def parse_modern_pixel_filename(self, filename: str, parent_row=None) -> Optional[Tuple]:
         """Parse modern Pixel device filenames (e.g., husky-ota-bp1a.250305.019-b4977f37.zip)"""
-        match = MODERN_PIXEL_PATTERN.match(filename)
-        if not match:
+        version_parts = _parse_modern_pixel_filename(filename)
+        if not version_parts:
             return None
-            
-        groups = match.groups()
-        if len(groups) >= 4:
-            device = groups[0]
-            build_prefix = groups[1].upper()
-            build_major = groups[2]
-            build_minor = groups[3]
-            build_variant = groups[4] if groups[4] else None
-            
-            # Determine Android version based on build prefix
-            # For legacy devices (like Nexus Player), use the original build version
-            if build_prefix.startswith('OPR'):
-                # This is a legacy device build (like Nexus Player)
-                build_version = f"{build_prefix}{build_major}{build_minor}"
-                if build_variant:
-                    build_version += f".{build_variant}"
-                # For legacy devices, we need to parse the version from the parent row
-                return None  # Return None to force legacy format parsing
-            elif build_prefix.startswith(('BP', 'AP4')):
-                android_version = "15.0.0"
-            elif build_prefix.startswith('AP3'):
-                android_version = "14.0.0"
-            elif build_prefix.startswith('AP2'):
-                android_version = "14.0.0"
-            else:
-                android_version = "13.0.0"  # fallback for older builds
-            
-            build_version = f"{build_prefix}{build_major}.{build_minor}"
-            if build_variant:
-                build_version += f".{build_variant}"
-            
-            # Try to get release date from parent row if available
-            release_date = "Unknown"
-            if parent_row:
-                version_cell = parent_row.find('td')
-                if version_cell:
-                    version_text = version_cell.text.strip()
-                    version_parts = self.parse_version_text(version_text)
-                    if version_parts:
-                        release_date = version_parts[3]  # Get release date from parsed version text
-            
-            return (android_version, build_version, None, release_date, None)
         
-        return None
+        # Try to get release date from parent row if available
+        if parent_row:
+            version_cell = parent_row.find('td')
+            if version_cell:
+                version_text = version_cell.text.strip()
+                row_version_parts = self.parse_version_text(version_text)
+                if row_version_parts:
+                    # Get release date from parsed version text
+                    return version_parts[:3] + (row_version_parts[3],) + version_parts[4:]
+        
+        return version_parts
     
     def parse_legacy_build(self, filename: str) -> Optional[Tuple]:
         """Parse legacy build filenames (e.g., bullhead-ota-nmf26f-27b4075c.zip)"""
-        match = LEGACY_BUILD_PATTERN.match(filename)
-        if not match:
+        filename_format, groups = _classify_filename(filename)
+        if filename_format != "legacy":
             return None
         
-        groups = match.groups()
         if len(groups) >= 3:
             device = groups[0]
             build_version = groups[1]
@@ -617,52 +1143,63 @@ class AndroidImageScraper:
         """
         Create a sorting key for version comparison.
         This ensures variants like .b1, .d1 are sorted properly.
+        The key is computed once when the AndroidImageInfo is created.
         """
-        # Extract the major Android version (e.g., 14.0.0 -> 14)
-        android_major = float(ota_info.android_version.split('.')[0])
-        
-        # Extract base build version and variant
-        build_parts = ota_info.build_version.split('.')
-        base_build = '.'.join(build_parts[:3])  # e.g., AP4A.250205.002
-        
-        # Determine if there's a variant code (like b1, a2, etc.)
-        variant_priority = 0
-        variant_number = 0
-        
-        if len(build_parts) > 3:
-            variant = build_parts[3]
-            # Set priority based on variant letter (a < b < c < d)
-            variant_priority_map = {'a': 1, 'b': 2, 'c': 3, 'd': 4}
-            for letter, priority in variant_priority_map.items():
-                if variant.startswith(letter):
-                    variant_priority = priority
-                    break
-                
-            # Extract variant number if present
-            if len(variant) > 1 and variant[1:].isdigit():
-                variant_number = int(variant[1:])
+        return ota_info._sort_key
+    
+    def get_soup(self, html: str) -> "BeautifulSoup":
+        """
+        Parse HTML into a BeautifulSoup tree, reusing the tree from an earlier call
+        with the same content.
         
-        # Sort by:
-        # 1. Android major version (e.g., 15, 14)
-        # 2. Base build version (e.g., AP4A.250205.002)
-        # 3. Build type priority (stable > qpr > preview > beta)
-        # 4. Variant priority (a < b < c < d)
-        # 5. Variant number (1, 2, 3, etc.)
-        # 6. Image type (stable > carrier > region-specific)
-        build_type_priority = {
-            "stable": 0,
-            "qpr": 1,
-            "preview": 2,
-            "beta": 3
-        }.get(ota_info.build_type, 4)  # Default to lowest priority
+        Args:
+            html: HTML content to parse
+            
+        Returns:
+            BeautifulSoup: Parsed document (shared, must not be modified)
+        """
+        key = hashlib.blake2b(html.encode('utf-8'), digest_size=16).digest()
+        with self._soup_lock:
+            soup = self._soup_cache.get(key)
+            if soup is None:
+                from bs4 import BeautifulSoup, SoupStrainer
+                soup = BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer(list(PAGE_STRAINER_TAGS)))
+                # Keep only the most recent pages (OTA and factory)
+                if len(self._soup_cache) >= 2:
+                    self._soup_cache.pop(next(iter(self._soup_cache)))
+                self._soup_cache[key] = soup
+            return soup
+    
+    def get_parsed_page(self, is_factory: bool = False, force_refresh: bool = False) -> Tuple[Optional[str], Dict[str, List[AndroidImageInfo]]]:
+        """
+        Fetch and parse the OTA or factory page, reusing this scraper's last result
+        while it is younger than the cache age limit.
         
-        image_type_priority = 0
-        if ota_info.is_carrier:
-            image_type_priority = 1
-        elif ota_info.is_region_specific:
-            image_type_priority = 2
+        Args:
+            is_factory: Whether to get the factory images page instead of the OTA page
+            force_refresh: Fetch and parse again even if a fresh result is held
             
-        return (android_major, base_build, build_type_priority, variant_priority, variant_number, image_type_priority)
+        Returns:
+            Tuple of the page HTML (None if it couldn't be fetched) and the parsed images
+        """
+        with self._parsed_pages_lock:
+            revalidate = is_factory in self._pending_revalidation
+            entry = self._parsed_pages.get(is_factory)
+            if entry and not force_refresh and not revalidate:
+                parsed_at, html, data = entry
+                if time.time() - parsed_at <= self.cache_max_age_days * 24 * 3600:
+                    return html, data
+            
+            html = self.fetch_page(self.factory_url if is_factory else None, is_factory=is_factory,
+                                   revalidate=revalidate)
+            if not html:
+                return None, {}
+            # Revalidate once per run; later calls reuse this result as usual
+            self._pending_revalidation.discard(is_factory)
+            
+            data = self.parse_page(html, is_factory=is_factory)
+            self._parsed_pages[is_factory] = (time.time(), html, data)
+            return html, data
     
     def parse_page(self, html: str, is_factory: bool = False) -> Dict[str, List[AndroidImageInfo]]:
         """
@@ -678,8 +1215,13 @@ class AndroidImageScraper:
         if not html:
             logger.error("No HTML content provided to parse")
             return {}
+        
+        # Reuse the result from an earlier run if this exact page was parsed before
+        cached_result = self.load_parse_cache(html, is_factory)
+        if cached_result is not None:
+            return cached_result
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self.get_soup(html)
         result = {}
         
         # Create a mapping of download URLs to their checksums from the initial page
@@ -721,63 +1263,68 @@ class AndroidImageScraper:
                     
                     # Try to extract a valid SHA256 hash from the checksum text
                     # This handles cases where .zip might be accidentally appended
-                    sha256_match = re.search(r'^[a-fA-F0-9]{64}', checksum) if checksum else None
-                    if sha256_match:
-                        valid_checksum = sha256_match.group(0)
+                    valid_checksum = _extract_sha256(checksum)
+                    if valid_checksum:
                         checksum_map[normalized_url] = valid_checksum
-                        logger.debug(f"Found checksum for {download_url}: {valid_checksum}")
+                        logger.debug("Found checksum for %s: %s", download_url, valid_checksum)
                     else:
-                        logger.debug(f"Invalid or truncated checksum for {download_url}: {checksum}")
+                        logger.debug("Invalid or truncated checksum for %s: %s", download_url, checksum)
+        
+        # Walk the page table by table so the h2 element before each table is
+        # looked up once, collecting every link that ends with .zip along with
+        # its row and that table's device codename
+        all_links = []
+        for table in soup.find_all('table'):
+            prev_h2 = table.find_previous('h2')
+            table_codename = prev_h2['id'] if prev_h2 and prev_h2.get('id') else None
+            for row in table.find_all('tr'):
+                for link in row.find_all('a', href=ZIP_HREF_PATTERN):
+                    all_links.append((link, row, table_codename))
         
         # Log the total number of links found
-        all_links = soup.find_all('a', href=lambda href: href and href.endswith('.zip'))
-        logger.debug(f"Found {len(all_links)} total .zip links")
+        logger.debug("Found %s total .zip links", len(all_links))
         
-        # Find all links that end with .zip
-        for link in all_links:
+        for link, parent_row, table_codename in all_links:
             download_url = link['href']
-            # Normalize URL for checksum lookup
-            normalized_url = download_url.rstrip('/').lower()
-            filename = download_url.split('/')[-1]
+            # Normalize URL for checksum lookup; links usually match a map key
+            # as-is, in which case they are already normalized
+            if download_url in checksum_map:
+                normalized_url = download_url
+            else:
+                normalized_url = download_url.rstrip('/').lower()
+            filename = download_url.rpartition('/')[2]
             
-            logger.debug(f"Processing link: {filename}")
+            logger.debug("Processing link: %s", filename)
             
-            # Get the parent row for version text
-            parent_row = link.find_parent('tr')
+            # Use the device codename from the h2 element before the table
+            device_codename = table_codename
+            if device_codename:
+                logger.debug("Found device codename from h2: %s", device_codename)
             
-            # Try to find the device codename from the h2 element before the table
-            device_codename = None
-            table = parent_row.find_parent('table')
-            if table:
-                prev_h2 = table.find_previous('h2')
-                if prev_h2 and prev_h2.get('id'):
-                    device_codename = prev_h2['id']
-                    logger.debug(f"Found device codename from h2: {device_codename}")
+            # Try to parse modern Pixel device filenames first; the result is used
+            # both for the codename fallback and for the image info below
+            version_parts = self.parse_modern_pixel_filename(filename, parent_row)
             
             # If we couldn't get the device codename from h2, try parsing from filename
             if not device_codename:
-                # Try to parse modern Pixel device filenames first
-                version_parts = self.parse_modern_pixel_filename(filename, parent_row)
                 if version_parts:
                     device_codename = version_parts[0]
                 else:
                     # Try to parse factory image format
                     if is_factory:
-                        factory_match = FACTORY_IMAGE_PATTERN.match(filename)
-                        if factory_match:
-                            device_codename = factory_match.group(1)
+                        filename_format, groups = _classify_filename(filename)
+                        if filename_format == "factory":
+                            device_codename = groups[0]
                     else:
                         # Try to parse legacy format
-                        device_match = re.search(r'([a-z]+)-ota-', filename)
+                        device_match = OTA_DEVICE_PATTERN.search(filename)
                         if device_match:
                             device_codename = device_match.group(1)
             
             if not device_codename:
-                logger.debug(f"Could not extract device codename from {filename}")
+                logger.debug("Could not extract device codename from %s", filename)
                 continue
                 
-            # Try to parse modern Pixel device filenames first
-            version_parts = self.parse_modern_pixel_filename(filename, parent_row)
             if version_parts:
                 # Get checksum from our mapping using normalized URL
                 checksum = checksum_map.get(normalized_url)
@@ -799,14 +1346,14 @@ class AndroidImageScraper:
                 if device_codename not in result:
                     result[device_codename] = []
                 result[device_codename].append(ota_info)
-                logger.debug(f"Added modern format {'factory image' if is_factory else 'OTA'} for {device_codename}: {ota_info.build_version}")
+                logger.debug("Added modern format %s for %s: %s", 'factory image' if is_factory else 'OTA', device_codename, ota_info.build_version)
                 continue
             
             # Try to parse factory image format
             if is_factory:
-                factory_match = FACTORY_IMAGE_PATTERN.match(filename)
-                if factory_match:
-                    build_version = factory_match.group(2)
+                filename_format, groups = _classify_filename(filename)
+                if filename_format == "factory":
+                    build_version = groups[1]
                     
                     # Get version text from parent row
                     version_text = None
@@ -853,18 +1400,18 @@ class AndroidImageScraper:
                     if device_codename not in result:
                         result[device_codename] = []
                     result[device_codename].append(ota_info)
-                    logger.debug(f"Added factory image for {device_codename}: {build_version}")
+                    logger.debug("Added factory image for %s: %s", device_codename, build_version)
                     continue
             
             # Try to parse legacy format
             if not parent_row:
-                logger.debug(f"No parent row found for {filename}")
+                logger.debug("No parent row found for %s", filename)
                 continue
                 
             # For factory images, version is in td[1], for OTAs it's in td[1]
             cells = parent_row.find_all('td')
             if len(cells) < 3:  # We only need 3 columns minimum for both factory and OTA images
-                logger.debug(f"Not enough cells in row for {filename} (found {len(cells)} cells)")
+                logger.debug("Not enough cells in row for %s (found %s cells)", filename, len(cells))
                 continue
                 
             # For factory images:
@@ -903,14 +1450,14 @@ class AndroidImageScraper:
                 version_cell = cells[0]  # Version is always in first column
                 
             if not version_cell:
-                logger.debug(f"No version cell found for {filename}")
+                logger.debug("No version cell found for %s", filename)
                 continue
                 
             version_text = version_cell.text.strip()
             version_parts = self.parse_version_text(version_text)
             
             if not version_parts:
-                logger.debug(f"Could not parse version text: {version_text}")
+                logger.debug("Could not parse version text: %s", version_text)
                 continue
                 
             # Get checksum from our mapping using normalized URL
@@ -934,12 +1481,13 @@ class AndroidImageScraper:
             if device_codename not in result:
                 result[device_codename] = []
             result[device_codename].append(ota_info)
-            logger.debug(f"Added legacy format {'factory image' if is_factory else 'OTA'} for {device_codename}: {ota_info.build_version}")
+            logger.debug("Added legacy format %s for %s: %s", 'factory image' if is_factory else 'OTA', device_codename, ota_info.build_version)
         
         # Sort each device's OTAs by our custom sorting function (newest first)
         for device in result:
-            result[device].sort(key=self.get_version_sort_key, reverse=True)
+            result[device].sort(key=VERSION_SORT_KEY, reverse=True)
         
+        self.save_parse_cache(html, is_factory, result)
         return result
     
     def fetch_checksum(self, download_url: str) -> Optional[str]:
@@ -971,26 +1519,21 @@ class AndroidImageScraper:
             if not os.path.exists(self.cache_file):
                 return False
                 
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                data = _json_loads(f.read())
                 
             # Check if data is a dictionary
             if not isinstance(data, dict):
                 return False
                 
-            # Check each device's entries
+            # Check each device's entries, stopping at the first invalid one
             for device, entries in data.items():
                 if not isinstance(entries, list):
                     return False
                     
                 for entry in entries:
                     # Check required fields
-                    required_fields = {
-                        'device', 'android_version', 'build_version',
-                        'release_date', 'download_url', 'filename',
-                        'last_checked'
-                    }
-                    if not all(field in entry for field in required_fields):
+                    if not isinstance(entry, dict) or not CACHE_REQUIRED_FIELDS.issubset(entry):
                         return False
                         
             return True
@@ -1006,13 +1549,14 @@ class AndroidImageScraper:
             if not os.path.exists(self.cache_file):
                 return
                 
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                data = _json_loads(f.read())
                 
             current_time = datetime.datetime.now()
             max_age = datetime.timedelta(days=self.cache_max_age_days)
             
-            # Clean up each device's entries
+            # Clean up each device's entries, noting whether anything expired
+            changed = False
             for device in list(data.keys()):
                 entries = data[device]
                 valid_entries = []
@@ -1022,34 +1566,52 @@ class AndroidImageScraper:
                     if current_time - last_checked <= max_age:
                         valid_entries.append(entry)
                 
+                if len(valid_entries) != len(entries):
+                    changed = True
                 if valid_entries:
                     data[device] = valid_entries
                 else:
                     del data[device]
             
-            # Save cleaned up data
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            # Save cleaned up data, skipping the rewrite when nothing expired
+            if changed:
+                _atomic_write_bytes(self.cache_file, _json_dumps(data, indent=True))
                 
             logger.info("Cache cleanup completed")
         except Exception as e:
             logger.error(f"Cache cleanup error: {e}")
     
     def load_cache(self) -> Dict:
-        """Load cached OTA data from file."""
+        """Load cached OTA data from file, validating entries as they are read."""
         try:
             if os.path.exists(self.cache_file):
-                # Validate cache before loading
-                if not self.validate_cache():
+                with open(self.cache_file, 'rb') as f:
+                    data = _json_loads(f.read())
+                
+                if not isinstance(data, dict):
                     logger.warning("Cache validation failed, creating new cache")
                     return {}
+                
+                # Validate and convert entries back to OTAInfo objects in a single
+                # pass, interning the values that repeat across entries so they
+                # share one string
+                interned_data = {}
+                for device, entries in data.items():
+                    if not isinstance(entries, list):
+                        logger.warning("Cache validation failed, creating new cache")
+                        return {}
                     
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Convert loaded data back to OTAInfo objects
-                    for device in data:
-                        data[device] = [AndroidImageInfo(**ota) for ota in data[device]]
-                    return data
+                    images = []
+                    for ota in entries:
+                        if not isinstance(ota, dict) or not CACHE_REQUIRED_FIELDS.issubset(ota):
+                            logger.warning("Cache validation failed, creating new cache")
+                            return {}
+                        for key in CACHE_INTERNED_FIELDS:
+                            if isinstance(ota.get(key), str):
+                                ota[key] = sys.intern(ota[key])
+                        images.append(AndroidImageInfo(**{key: value for key, value in ota.items() if key in IMAGE_INIT_FIELDS}))
+                    interned_data[sys.intern(device)] = images
+                return interned_data
         except Exception as e:
             logger.error(f"Error loading cache: {e}")
         return {}
@@ -1062,8 +1624,7 @@ class AndroidImageScraper:
             for device in data:
                 cache_data[device] = [ota.to_dict() for ota in data[device]]
             
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+            _atomic_write_bytes(self.cache_file, _json_dumps(cache_data, indent=True))
         except Exception as e:
             logger.error(f"Error saving cache: {e}")
     
@@ -1076,20 +1637,17 @@ class AndroidImageScraper:
                 new_images[device] = new_otas
                 continue
                 
-            old_otas = old_data[device]
-            new_device_otas = []
-            
-            for new_ota in new_otas:
-                # Check if this OTA is new or has been updated
-                is_new = True
-                for old_ota in old_otas:
-                    if (new_ota.android_version == old_ota.android_version and 
-                        new_ota.build_version == old_ota.build_version):
-                        is_new = False
-                        break
-                
-                if is_new:
-                    new_device_otas.append(new_ota)
+            # Versions we already knew about, for constant-time lookups
+            old_versions = {
+                (old_ota.android_version, old_ota.build_version)
+                for old_ota in old_data[device]
+            }
+            
+            # Check if each OTA is new or has been updated
+            new_device_otas = [
+                new_ota for new_ota in new_otas
+                if (new_ota.android_version, new_ota.build_version) not in old_versions
+            ]
             
             if new_device_otas:
                 new_images[device] = new_device_otas
@@ -1103,6 +1661,11 @@ class AndroidImageScraper:
         Returns:
             Dict containing device codenames as keys and lists of new images as values
         """
+        # Drop memoized parse results from any previous scrape
+        _parse_version_text.cache_clear()
+        _parse_modern_pixel_filename.cache_clear()
+        _classify_filename.cache_clear()
+        
         # Clean up old cache entries
         self.cleanup_cache()
         
@@ -1110,14 +1673,11 @@ class AndroidImageScraper:
         old_data = self.load_cache()
         
         # Fetch and parse page
-        html = self.fetch_page()
+        html, new_data = self.get_parsed_page(force_refresh=True)
         if not html:
             logger.error("Failed to fetch page, aborting")
             return {}
         
-        # Parse the page
-        new_data = self.parse_page(html)
-        
         # Save the new data
         self.save_cache(new_data)
         
@@ -1126,6 +1686,18 @@ class AndroidImageScraper:
         
         return new_images
     
+    def _get_row_checksum(self, row, download_url: str) -> Optional[str]:
+        """Return the SHA256 checksum from the third cell of an OTA table row, if valid."""
+        if not row:
+            return None
+        cells = row.find_all('td')
+        if len(cells) < 3:
+            return None
+        checksum = _extract_sha256(cells[2].text.strip())
+        if checksum:
+            logger.debug("Found checksum for %s: %s", download_url, checksum)
+        return checksum
+    
     def get_latest_ota(self, device_codename: str, 
                       include_beta: bool = False,
                       prefer_stable: bool = True,
@@ -1134,7 +1706,8 @@ class AndroidImageScraper:
                       prefer_factory_images: bool = False,
                       carrier: Optional[str] = None,
                       region: Optional[str] = None,
-                      specific_build: Optional[str] = None) -> Optional[AndroidImageInfo]:
+                      specific_build: Optional[str] = None,
+                      force_refresh: bool = False) -> Optional[AndroidImageInfo]:
         """
         Get the latest OTA for a specific device with filtering options.
         
@@ -1148,90 +1721,58 @@ class AndroidImageScraper:
             carrier: Specific carrier to filter for (e.g., "T-Mobile", "Verizon")
             region: Specific region to filter for (e.g., "EMEA", "India")
             specific_build: Specific build number to look for (e.g., "BP1A.250305.019")
+            force_refresh: Re-read the page instead of reusing this scraper's last parse
             
         Returns:
             Latest OTA info or None if not found
         """
-        # Fetch and parse page
-        html = self.fetch_page()
+        # Fetch and parse page (reused from earlier calls while still fresh)
+        html, data = self.get_parsed_page(force_refresh=force_refresh)
         if not html:
             logger.error("Failed to fetch page, aborting")
             return None
         
-        # Parse the page
-        data = self.parse_page(html)
-        
         # First try exact match
         if device_codename in data and data[device_codename]:
             logger.info(f"Found {len(data[device_codename])} OTAs for device: {device_codename}")
             matching_otas = data[device_codename]
         else:
             # If not found, try to find rows that contain the device codename in download URLs
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.get_soup(html)
             matching_otas = []
             
-            # Build the search pattern for the device in the link
-            link_pattern = f"{device_codename}-ota-"
+            # Build the search pattern for the device in the link: "<codename>-ota-"
+            # anywhere before the .zip extension. Only the href is case-folded, as
+            # it was when the codename was looked up in href.lower(), so a codename
+            # with capitals matches no links at all
+            links = []
+            if device_codename == device_codename.lower():
+                link_pattern = re.compile(f"(?i:{re.escape(device_codename)}-ota-).*\\.zip\\Z", re.DOTALL)
+                links = soup.find_all('a', href=link_pattern)
             
             # Find all links that contain the device name
-            for link in soup.find_all('a', href=lambda href: href and link_pattern in href.lower() and href.endswith('.zip')):
+            for link in links:
                 download_url = link['href']
-                filename = download_url.split('/')[-1]
+                filename = download_url.rpartition('/')[2]
                 
                 # Get the parent row for version text
                 parent_row = link.find_parent('tr')
                 
                 # Try to parse modern Pixel device filenames first
                 version_parts = self.parse_modern_pixel_filename(filename, parent_row)
-                if version_parts:
-                    # Get checksum from the table
-                    checksum = None
-                    if parent_row:
-                        cells = parent_row.find_all('td')
-                        if len(cells) >= 3:
-                            checksum_text = cells[2].text.strip()
-                            sha256_match = re.search(r'^[a-fA-F0-9]{64}', checksum_text)
-                            if sha256_match:
-                                checksum = sha256_match.group(0)
-                                logger.debug(f"Found checksum for {download_url}: {checksum}")
-                    
-                    ota_info = AndroidImageInfo(
-                        device=device_codename,
-                        android_version=version_parts[0],
-                        build_version=version_parts[1],
-                        sub_version=version_parts[2],
-                        release_date=version_parts[3],
-                        additional_info=version_parts[4],
-                        download_url=download_url,
-                        checksum=checksum
-                    )
-                    matching_otas.append(ota_info)
-                    continue
-                
-                # Try to parse legacy format
-                parent_row = link.find_parent('tr')
-                if not parent_row:
-                    continue
-                    
-                version_cell = parent_row.find('td')
-                if not version_cell:
-                    continue
-                    
-                version_text = version_cell.text.strip()
-                version_parts = self.parse_version_text(version_text)
-                
                 if not version_parts:
-                    continue
+                    # Try to parse legacy format from the row's version cell
+                    version_cell = parent_row.find('td') if parent_row else None
+                    if not version_cell:
+                        continue
+                    
+                    version_text = version_cell.text.strip()
+                    version_parts = self.parse_version_text(version_text)
+                    if not version_parts:
+                        continue
                 
                 # Get checksum from the table
-                cells = parent_row.find_all('td')
-                checksum = None
-                if len(cells) >= 3:
-                    checksum_text = cells[2].text.strip()
-                    sha256_match = re.search(r'^[a-fA-F0-9]{64}', checksum_text)
-                    if sha256_match:
-                        checksum = sha256_match.group(0)
-                        logger.debug(f"Found checksum for {download_url}: {checksum}")
+                checksum = self._get_row_checksum(parent_row, download_url)
                 
                 ota_info = AndroidImageInfo(
                     device=device_codename,
@@ -1243,7 +1784,6 @@ class AndroidImageScraper:
                     download_url=download_url,
                     checksum=checksum
                 )
-                
                 matching_otas.append(ota_info)
         
         if not matching_otas:
@@ -1263,57 +1803,43 @@ class AndroidImageScraper:
                 return None
             logger.info(f"Found OTA with specific build number: {specific_build}")
         
-        # Filter out beta builds if not included
-        if not include_beta:
-            filtered_otas = [ota for ota in filtered_otas if not ota.is_beta]
-            logger.info(f"Filtered out beta builds. Remaining: {len(filtered_otas)}")
-        
-        # Filter out carrier-specific builds if not included
-        if not include_carrier:
-            filtered_otas = [ota for ota in filtered_otas if not ota.is_carrier]
-            logger.info(f"Filtered out carrier builds. Remaining: {len(filtered_otas)}")
-        
-        # Filter out region-specific builds if not included
-        if not include_region_specific:
-            filtered_otas = [ota for ota in filtered_otas if not ota.is_region_specific]
-            logger.info(f"Filtered out region-specific builds. Remaining: {len(filtered_otas)}")
+        # Apply the remaining preference filters in a single pass
+        def keep(ota: AndroidImageInfo) -> bool:
+            return ((include_beta or not ota.is_beta) and
+                    (include_carrier or not ota.is_carrier) and
+                    (include_region_specific or not ota.is_region_specific) and
+                    (not carrier or ota.carrier == carrier) and
+                    (not region or ota.region == region))
         
-        # Filter by specific carrier if requested
-        if carrier:
-            filtered_otas = [ota for ota in filtered_otas if ota.carrier == carrier]
-            logger.info(f"Filtered for carrier {carrier}. Remaining: {len(filtered_otas)}")
+        filtered_otas = [ota for ota in filtered_otas if keep(ota)]
         
-        # Filter by specific region if requested
-        if region:
-            filtered_otas = [ota for ota in filtered_otas if ota.region == region]
-            logger.info(f"Filtered for region {region}. Remaining: {len(filtered_otas)}")
+        logger.info(f"Filtered by build type, carrier and region preferences. Remaining: {len(filtered_otas)}")
         
         if not filtered_otas:
             logger.error(f"No matching OTAs found for device {device_codename} after filtering")
             return None
         
-        # Sort all OTAs by version
-        all_sorted_otas = sorted(
-            filtered_otas, 
-            key=self.get_version_sort_key, 
-            reverse=True
-        )
-        
         # If prefer_stable is True, try to find the newest stable version first
         if prefer_stable:
-            stable_otas = [ota for ota in all_sorted_otas if ota.build_type == "stable"]
+            latest_stable = max(
+                (ota for ota in filtered_otas if ota.build_type == "stable"),
+                key=VERSION_SORT_KEY,
+                default=None
+            )
             
-            if stable_otas:
-                logger.info(f"Using stable build for {device_codename}: {stable_otas[0].build_version}")
-                if stable_otas[0].checksum:
-                    logger.info(f"Found checksum for stable build: {stable_otas[0].checksum}")
-                return stable_otas[0]
-        
-        # Either prefer_stable is False or no stable builds found
-        logger.info(f"Using build for {device_codename}: {all_sorted_otas[0].build_version}")
-        if all_sorted_otas[0].checksum:
-            logger.info(f"Found checksum for build: {all_sorted_otas[0].checksum}")
-        return all_sorted_otas[0]
+            if latest_stable:
+                logger.info(f"Using stable build for {device_codename}: {latest_stable.build_version}")
+                if latest_stable.checksum:
+                    logger.info(f"Found checksum for stable build: {latest_stable.checksum}")
+                return latest_stable
+        
+        # Either prefer_stable is False or no stable builds found; only the
+        # newest OTA is needed, so take the max instead of sorting
+        latest_ota = max(filtered_otas, key=VERSION_SORT_KEY)
+        logger.info(f"Using build for {device_codename}: {latest_ota.build_version}")
+        if latest_ota.checksum:
+            logger.info(f"Found checksum for build: {latest_ota.checksum}")
+        return latest_ota
     
     def analyze_family_update_status(self, family_name: str, **kwargs) -> Dict:
         """
@@ -1397,31 +1923,28 @@ class AndroidImageScraper:
             }
             
         try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                cache_data = _json_loads(f.read())
                 
             total_entries = sum(len(entries) for entries in cache_data.values())
             total_size_bytes = os.path.getsize(self.cache_file)
-            last_modified = datetime.fromtimestamp(os.path.getmtime(self.cache_file))
+            last_modified = datetime.datetime.fromtimestamp(os.path.getmtime(self.cache_file))
             
             # Count entries by device
-            devices = {}
-            for build_id, entries in cache_data.items():
-                for entry in entries:
-                    device = entry.get('device')
-                    if device:
-                        if device not in devices:
-                            devices[device] = 0
-                        devices[device] += 1
-            
-            # Count entries by family
-            families = {}
+            device_counts = Counter(
+                entry.get('device')
+                for entries in cache_data.values()
+                for entry in entries
+            )
+            devices = {device: count for device, count in device_counts.items() if device}
+            
+            # Count entries by family, looking each unique device up once
+            families = Counter()
             for device, count in devices.items():
-                family = self.get_device_family(device)
+                family = DEVICE_TO_FAMILY.get(device)
                 if family:
-                    if family not in families:
-                        families[family] = 0
                     families[family] += count
+            families = dict(families)
             
             return {
                 "status": "success",
@@ -1452,6 +1975,20 @@ class AndroidImageScraper:
             bool: True if successful, False otherwise
         """
         try:
+            # Drop the compressed page and parse caches too so the next run
+            # refetches, along with any temporary files left by interrupted writes
+            for page_cache_file in (self.get_page_cache_file(), self.get_page_cache_file(is_factory=True)):
+                for path in (page_cache_file, f"{page_cache_file}.tmp"):
+                    if os.path.exists(path):
+                        os.remove(path)
+            if os.path.isdir(self.parse_cache_dir):
+                for name in os.listdir(self.parse_cache_dir):
+                    if name.startswith("parsed_") and name.endswith((".json", ".json.tmp", ".pkl", ".pkl.tmp")):
+                        os.remove(os.path.join(self.parse_cache_dir, name))
+            if os.path.exists(f"{self.cache_file}.tmp"):
+                os.remove(f"{self.cache_file}.tmp")
+            _hash_cache.prune()
+            
             if os.path.exists(self.cache_file):
                 os.remove(self.cache_file)
                 logger.info("Cache file cleared successfully")
@@ -1474,15 +2011,12 @@ class AndroidImageScraper:
         Returns:
             Latest factory image info or None if not found
         """
-        # Fetch and parse factory images page
-        html = self.fetch_page(self.factory_url, is_factory=True)
+        # Fetch and parse factory images page (with is_factory=True to use correct column mapping)
+        html, data = self.get_parsed_page(is_factory=True)
         if not html:
             logger.error("Failed to fetch factory images page, aborting")
             return None
         
-        # Parse the page with is_factory=True to use correct column mapping
-        data = self.parse_page(html, is_factory=True)
-        
         if device_codename in data and data[device_codename]:
             logger.info(f"Found {len(data[device_codename])} factory images for device: {device_codename}")
             matching_images = data[device_codename]
@@ -1492,14 +2026,8 @@ class AndroidImageScraper:
             
         logger.info(f"Found {len(matching_images)} factory images for device {device_codename}")
         
-        # Sort by version and return the latest
-        all_sorted_images = sorted(
-            matching_images,
-            key=self.get_version_sort_key,
-            reverse=True
-        )
-        
-        return all_sorted_images[0]
+        # Return the latest by version
+        return max(matching_images, key=VERSION_SORT_KEY)
 
 
 def print_security_warning(message: str):
@@ -1513,13 +2041,225 @@ def print_security_warning(message: str):
         print(f"SECURITY WARNING: {message}")
         print(f"{'!' * 80}\n")
 
-def verify_file_hash(file_path: str, expected_hash: str) -> bool:
+class _ProgressThrottle:
+    """Decides when a progress line is worth redrawing."""
+    
+    def __init__(self):
+        self._percent = -1
+        self._last_draw = 0.0
+    
+    def should_draw(self, percent: int) -> bool:
+        """
+        Check whether to redraw for the given percentage.
+        
+        Redraws happen only when the percentage changed and at most once per
+        PROGRESS_REDRAW_INTERVAL, except that 100% is always drawn.
+        """
+        if percent == self._percent:
+            return False
+        now = time.monotonic()
+        if percent < 100 and now - self._last_draw < PROGRESS_REDRAW_INTERVAL:
+            return False
+        self._percent = percent
+        self._last_draw = now
+        return True
+
+class _HashProgressReader:
+    """Binary file wrapper that prints verification progress as it is read."""
+    
+    def __init__(self, file: BinaryIO, total_size: int):
+        self._file = file
+        self._total_size = total_size
+        self._processed = 0
+        self._throttle = _ProgressThrottle()
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        size = self._file.readinto(buffer)
+        if size:
+            self._processed += size
+            # Redraw only occasionally, not on every block
+            percent = 100 * self._processed // self._total_size if self._total_size else 100
+            if self._throttle.should_draw(percent):
+                sys.stdout.write(f"\r{Fore.CYAN}Verifying:{Style.RESET_ALL} {percent}% ({self._processed}/{self._total_size} bytes)")
+                sys.stdout.flush()
+        return size
+
+class _HashCache:
+    """
+    Remembers the SHA256 of local files so unchanged files are not re-read.
+    
+    Entries are keyed by absolute path and only trusted while the file's
+    modification time and size still match the values recorded with the digest.
+    """
+    
+    def __init__(self, cache_file: str):
+        self.cache_file = cache_file
+        self._entries = None
+        self._lock = threading.Lock()
+    
+    def _load(self) -> Dict[str, List]:
+        # Read the sidecar lazily, on first use
+        if self._entries is None:
+            try:
+                with open(self.cache_file, 'rb') as f:
+                    self._entries = _json_loads(f.read())
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+    
+    def _save(self) -> None:
+        try:
+            _atomic_write_bytes(self.cache_file, _json_dumps(self._entries))
+        except OSError as e:
+            logger.warning(f"Error saving hash cache: {e}")
+    
+    def get(self, file_path: str) -> Optional[str]:
+        """
+        Get the remembered SHA256 of a file.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            The hex digest, or None if unknown or the file changed since
+        """
+        stat = os.stat(file_path)
+        with self._lock:
+            entry = self._load().get(os.path.abspath(file_path))
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+        return None
+    
+    def put(self, file_path: str, digest: str) -> None:
+        """
+        Remember the SHA256 of a file at its current modification time and size.
+        
+        Args:
+            file_path: Path to the file
+            digest: Hex digest of the file contents
+        """
+        stat = os.stat(file_path)
+        with self._lock:
+            self._load()[os.path.abspath(file_path)] = [stat.st_mtime_ns, stat.st_size, digest]
+            self._save()
+    
+    def prune(self) -> None:
+        """Forget files that no longer exist."""
+        with self._lock:
+            entries = self._load()
+            missing = [path for path in entries if not os.path.exists(path)]
+            if missing:
+                for path in missing:
+                    del entries[path]
+                self._save()
+
+# Digests shared by verify_file_hash and download_with_progress
+_hash_cache = _HashCache(HASH_CACHE_FILE)
+
+def _hash_matches(file_path: str, actual_hash: str, expected_hash: str) -> bool:
+    """
+    Compare a computed SHA256 against the expected value and report mismatches.
+    
+    Args:
+        file_path: Path of the file the hash was computed for
+        actual_hash: Hex digest of the file contents
+        expected_hash: Expected hash value (can be full SHA256 or shortened version)
+        
+    Returns:
+        bool: True if hash matches, False otherwise
+    """
+    # If the expected hash is 8 characters, it's a shortened version
+    if len(expected_hash) == 8:
+        if actual_hash.startswith(expected_hash):
+            return True
+        print_error(f"Hash mismatch for {os.path.basename(file_path)}:")
+        print_error(f"  Expected (short): {expected_hash}")
+        print_error(f"  Actual (short):   {actual_hash[:8]}")
+        return False
+    # If it's 64 characters, it's the full SHA256 hash
+    elif len(expected_hash) == 64:
+        if actual_hash == expected_hash:
+            return True
+        print_error(f"Hash mismatch for {os.path.basename(file_path)}:")
+        print_error(f"  Expected: {expected_hash}")
+        print_error(f"  Actual:   {actual_hash}")
+        return False
+    else:
+        print_security_warning(f"Unsupported hash length: {len(expected_hash)}. File integrity cannot be verified!")
+        return False
+
+def _file_sha256(file_path: str, show_progress: bool = True) -> str:
+    """
+    Compute the SHA256 of a file, showing progress on interactive terminals.
+    
+    Args:
+        file_path: Path to the file to hash
+        show_progress: Whether a progress line may be drawn
+        
+    Returns:
+        str: Hex digest of the file contents
+    """
+    # Only draw the progress line on an interactive terminal
+    show_progress = show_progress and is_interactive_terminal()
+    file_size = os.path.getsize(file_path)
+    
+    with open(file_path, 'rb') as f:
+        # Ask for aggressive readahead while hashing and drop the pages again
+        # afterwards, so verifying a multi-GB image does not evict the rest of
+        # the page cache
+        fadvise = getattr(os, 'posix_fadvise', None)
+        if fadvise:
+            fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        try:
+            # Hash large files straight from the page cache without copying them
+            # through a read buffer; progress needs the reads, so only when silent
+            if not show_progress and os.name == 'posix' and file_size >= MMAP_HASH_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if hasattr(mapped, 'madvise'):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                    hash_obj = hashlib.sha256(mapped)
+            else:
+                # Report progress from the reads themselves so the hashing loop
+                # needs no per-block bookkeeping
+                reader = _HashProgressReader(f, file_size) if show_progress else f
+                
+                if hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: let hashlib drive the reads into a reused buffer
+                    hash_obj = hashlib.file_digest(reader, 'sha256')
+                else:
+                    # Initialize SHA256 hash object (Google uses SHA256 for OTA files)
+                    hash_obj = hashlib.sha256()
+                    buffer = bytearray(1024 * 1024)  # 1 MB chunks
+                    view = memoryview(buffer)
+                    while True:
+                        size = reader.readinto(buffer)
+                        if not size:
+                            break
+                        hash_obj.update(view[:size])
+        finally:
+            if fadvise:
+                fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    
+    if show_progress:
+        print()  # New line after progress bar
+    
+    return hash_obj.hexdigest()
+
+def verify_file_hash(file_path: str, expected_hash: str, show_progress: bool = True,
+                     use_cache: bool = False) -> bool:
     """
     Verify the hash of an existing file.
     
     Args:
         file_path: Path to the file to verify
         expected_hash: Expected hash value (can be full SHA256 or shortened version)
+        show_progress: Whether a progress line may be drawn while hashing
+        use_cache: Trust a digest remembered for the file's current mtime and size
+            instead of reading it; only for opportunistic checks, never explicit ones
         
     Returns:
         bool: True if hash matches, False otherwise
@@ -1527,98 +2267,298 @@ def verify_file_hash(file_path: str, expected_hash: str) -> bool:
     try:
         print_info(f"Verifying SHA256 hash for {os.path.basename(file_path)}...")
         
-        block_size = 8192  # 8 KB chunks
+        # Files hashed before and unchanged since need no re-read
+        actual_hash = _hash_cache.get(file_path) if use_cache else None
+        if actual_hash:
+            return _hash_matches(file_path, actual_hash, expected_hash)
         
-        # Initialize SHA256 hash object (Google uses SHA256 for OTA files)
-        hash_obj = hashlib.sha256()
+        actual_hash = _file_sha256(file_path, show_progress)
+        # Explicit verifications never consult the cache, so they don't feed it either
+        if use_cache:
+            _hash_cache.put(file_path, actual_hash)
+        return _hash_matches(file_path, actual_hash, expected_hash)
         
-        # Get file size for progress calculation
-        file_size = os.path.getsize(file_path)
-        processed = 0
+    except Exception as e:
+        print_security_warning(f"Error verifying file hash: {e}. File integrity cannot be verified!")
+        return False
+
+def verify_file_hashes(files: List[Tuple[str, str]]) -> List[bool]:
+    """
+    Verify several files at once, hashing them concurrently.
+    
+    Args:
+        files: (file_path, expected_hash) pairs
         
-        with open(file_path, 'rb') as f:
-            while True:
-                data = f.read(block_size)
-                if not data:
-                    break
-                hash_obj.update(data)
-                processed += len(data)
-                
-                # Show progress for interactive terminals
-                if is_interactive_terminal():
-                    percent = int(100 * processed / file_size)
-                    sys.stdout.write(f"\r{Fore.CYAN}Verifying:{Style.RESET_ALL} {percent}% ({processed}/{file_size} bytes)")
-                    sys.stdout.flush()
+    Returns:
+        List[bool]: Verification result for each pair, in order
+    """
+    if len(files) == 1:
+        return [verify_file_hash(*files[0])]
+    
+    # hashlib releases the GIL while hashing, so files are hashed on separate
+    # cores; progress lines from several threads would interleave, so skip them
+    with ThreadPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as executor:
+        return list(executor.map(lambda item: verify_file_hash(*item, show_progress=False), files))
+
+def _consume_chunks(chunks: queue.Queue, consume) -> None:
+    """
+    Feed queued download chunks to a consumer until the None sentinel arrives.
+    
+    Args:
+        chunks: Queue of bytes objects terminated by None
+        consume: Callable receiving each chunk, e.g. a file's write method
+    """
+    error = None
+    while True:
+        data = chunks.get()
+        if data is None:
+            break
+        # Keep draining after a failure so the producer never blocks on a full queue
+        if error is None:
+            try:
+                consume(data)
+            except Exception as e:
+                error = e
+    if error is not None:
+        raise error
+
+# Keep-alive session shared by all file downloads, with enough pooled
+# connections for parallel range requests. Images are fetched uncompressed so
+# the received bytes can be written and hashed as-is, without a decoding step
+_download_session = requests.Session()
+_download_session.headers['Accept-Encoding'] = 'identity'
+_download_session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=DOWNLOAD_POOL_SIZE))
+_download_session.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=DOWNLOAD_POOL_SIZE))
+
+def _download_stream(url: str, output_file: str, hash_content: bool) -> Optional[str]:
+    """
+    Download a file as a single stream, resuming an interrupted earlier attempt.
+    
+    Data is written to a .part file next to output_file that is renamed into
+    place once complete, so an interrupted download can continue where it
+    stopped on the next call.
+    
+    Args:
+        url: URL to download
+        output_file: Path the file is written to
+        hash_content: Whether to compute the SHA256 of the downloaded data
         
-        if is_interactive_terminal():
-            print()  # New line after progress bar
+    Returns:
+        The hex digest when hash_content is set, otherwise None
+    """
+    part_file = f"{output_file}.part"
+    offset = os.path.getsize(part_file) if os.path.exists(part_file) else 0
+    
+    response = _download_session.get(url, headers={'Range': f"bytes={offset}-"} if offset else None, stream=True,
+                                     timeout=DOWNLOAD_TIMEOUT)
+    if offset and response.status_code == 416:
+        # The part file is no prefix of the current file, start over
+        response.close()
+        offset = 0
+        response = _download_session.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT)
+    response.raise_for_status()
+    
+    # Only append when the server really continues where the part file ends
+    if offset and not (response.status_code == 206 and
+                       response.headers.get('content-range', '').startswith(f"bytes {offset}-")):
+        offset = 0
+    
+    remaining = int(response.headers.get('content-length', 0))
+    total_size = offset + remaining if remaining else 0
+    block_size = 1 << 20  # 1 MB chunks
+    downloaded = offset
+    throttle = _ProgressThrottle()
+
+    # Hash the chunks as they arrive instead of re-reading the file afterwards
+    hash_obj = hashlib.sha256() if hash_content else None
+    if offset:
+        print_info(f"Resuming download of {os.path.basename(output_file)} at byte {offset}")
+        # Seed the hash with the bytes already on disk
+        if hash_obj:
+            with open(part_file, 'rb') as f:
+                while True:
+                    data = f.read(block_size)
+                    if not data:
+                        break
+                    hash_obj.update(data)
+
+    # Download with progress bar, handing each chunk to separate writer and
+    # hasher threads so receiving, writing and hashing overlap
+    with open(part_file, 'ab' if offset else 'wb') as f, ThreadPoolExecutor(max_workers=2) as pipeline:
+        consumers = [(f.write, queue.Queue(maxsize=DOWNLOAD_QUEUE_SIZE))]
+        if hash_obj:
+            consumers.append((hash_obj.update, queue.Queue(maxsize=DOWNLOAD_QUEUE_SIZE)))
+        futures = [pipeline.submit(_consume_chunks, chunks, consume) for consume, chunks in consumers]
         
-        actual_hash = hash_obj.hexdigest()
+        try:
+            for data in response.raw.stream(block_size, decode_content=False):
+                downloaded += len(data)
+                for _, chunks in consumers:
+                    chunks.put(data)
+                # Redraw only occasionally, not on every chunk
+                if total_size:
+                    percent = int(100 * downloaded / total_size)
+                    if throttle.should_draw(percent):
+                        print_download_progress(percent, downloaded, total_size)
+        finally:
+            # Always release the consumers, even if the transfer failed
+            for _, chunks in consumers:
+                chunks.put(None)
+        
+        # Surface any write or hash error raised in the consumer threads
+        for future in futures:
+            future.result()
+        
+        # The data was hashed in flight and is not read back, so let the
+        # kernel recycle its cached pages instead of evicting others
+        if hasattr(os, 'posix_fadvise'):
+            f.flush()
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    
+    os.replace(part_file, output_file)
+    return hash_obj.hexdigest() if hash_obj else None
+
+def _download_ranges(url: str, output_file: str, total_size: int, parts: int) -> bool:
+    """
+    Download a file as byte ranges fetched in parallel over separate connections.
+    
+    Args:
+        url: URL to download; the server must support range requests
+        output_file: Path the file is written to
+        total_size: Size of the file in bytes
+        parts: Number of ranges fetched concurrently
         
-        # If the expected hash is 8 characters, it's a shortened version
-        if len(expected_hash) == 8:
-            if actual_hash.startswith(expected_hash):
-                return True
-            print_error(f"Hash mismatch for {os.path.basename(file_path)}:")
-            print_error(f"  Expected (short): {expected_hash}")
-            print_error(f"  Actual (short):   {actual_hash[:8]}")
-            return False
-        # If it's 64 characters, it's the full SHA256 hash
-        elif len(expected_hash) == 64:
-            if actual_hash == expected_hash:
-                return True
-            print_error(f"Hash mismatch for {os.path.basename(file_path)}:")
-            print_error(f"  Expected: {expected_hash}")
-            print_error(f"  Actual:   {actual_hash}")
-            return False
-        else:
-            print_security_warning(f"Unsupported hash length: {len(expected_hash)}. File integrity cannot be verified!")
-            return False
+    Returns:
+        True once the file is complete, or False (with nothing written) if the
+        server answered a range request with the whole file instead
+    """
+    part_size = -(-total_size // parts)
+    progress_lock = threading.Lock()
+    progress = {'downloaded': 0}
+    throttle = _ProgressThrottle()
+    # Set when a part fails or the download is interrupted, so the other
+    # parts stop instead of downloading the rest of the file
+    stop = threading.Event()
+    ranges_ignored = threading.Event()
+    
+    def fetch_part(start: int) -> None:
+        if stop.is_set():
+            return
+        end = min(start + part_size, total_size) - 1
+        headers = {'Range': f"bytes={start}-{end}"}
+        written = 0
+        with _download_session.get(url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                # Accept-Ranges promised more than the server does; stop every
+                # part so the caller can fall back to a single stream
+                ranges_ignored.set()
+                stop.set()
+                return
             
-    except Exception as e:
-        print_security_warning(f"Error verifying file hash: {e}. File integrity cannot be verified!")
+            # Each part writes into its own slice of the preallocated file
+            with open(parts_file, 'r+b') as f:
+                f.seek(start)
+                for data in response.raw.stream(1 << 20, decode_content=False):
+                    if stop.is_set():
+                        return
+                    f.write(data)
+                    written += len(data)
+                    with progress_lock:
+                        progress['downloaded'] += len(data)
+                        percent = int(100 * progress['downloaded'] / total_size)
+                        if throttle.should_draw(percent):
+                            print_download_progress(percent, progress['downloaded'], total_size)
+        
+        if written != end - start + 1:
+            raise IOError(f"Incomplete range bytes {start}-{end}: received {written} bytes")
+    
+    # Preallocate the file so the parts can be written in any order, reserving
+    # the blocks up front where supported to avoid a fragmented sparse file.
+    # It has holes until every part finishes, so it is never resumed like a
+    # .part file and only renamed into place once complete
+    parts_file = f"{output_file}.parts"
+    with open(parts_file, 'wb') as f:
+        if hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(f.fileno(), 0, total_size)
+        else:
+            f.truncate(total_size)
+    
+    pool = ThreadPoolExecutor(max_workers=parts)
+    futures = []
+    try:
+        futures = [pool.submit(fetch_part, start) for start in range(0, total_size, part_size)]
+        for future in futures:
+            future.result()
+    except BaseException:
+        # Drop parts that haven't started and wait only for the running ones
+        # to notice the stop event (within one chunk) before removing the file
+        stop.set()
+        for future in futures:
+            future.cancel()
+        pool.shutdown(wait=True)
+        os.remove(parts_file)
+        raise
+    pool.shutdown(wait=True)
+    if ranges_ignored.is_set():
+        os.remove(parts_file)
         return False
+    os.replace(parts_file, output_file)
+    return True
 
-def download_with_progress(url: str, output_file: str, verify_hash: bool = True, expected_hash: Optional[str] = None) -> bool:
+def download_with_progress(url: str, output_file: str, verify_hash: bool = True, expected_hash: Optional[str] = None,
+                           parallel: int = DOWNLOAD_PARALLEL_PARTS, trust_existing: bool = False) -> bool:
     """Download a file with progress bar and optional hash verification"""
+    # Full SHA256 hashes and the 8 character short form can both be checked
+    check_hash = expected_hash if expected_hash and len(expected_hash) in (8, 64) else None
     try:
         # Check if file exists and verify hash if needed
         if os.path.exists(output_file):
-            if expected_hash and len(expected_hash) == 64:  # Only verify if we have a full SHA256 hash
-                if verify_file_hash(output_file, expected_hash):
+            if check_hash:
+                if verify_file_hash(output_file, check_hash, use_cache=True):
                     print_success(f"File exists and hash verified: {os.path.basename(output_file)}")
                     return True
                 else:
                     print_warning(f"File exists but hash mismatch, will re-download: {os.path.basename(output_file)}")
                     os.remove(output_file)
-            else:
+            elif trust_existing:
                 print_security_warning(f"File exists but no valid hash provided for verification: {os.path.basename(output_file)}")
                 return True
+            else:
+                print_warning(f"File exists but no valid hash provided for verification, will re-download: {os.path.basename(output_file)}")
+                os.remove(output_file)
 
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
-        # Get file size
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
-        total_size = int(response.headers.get('content-length', 0))
-        block_size = 8192
-        downloaded = 0
-
-        # Download with progress bar
-        with open(output_file, 'wb') as f:
-            for data in response.iter_content(block_size):
-                downloaded += len(data)
-                f.write(data)
-                if total_size:
-                    percent = int(100 * downloaded / total_size)
-                    print_download_progress(percent, downloaded, total_size)
-
-        print()  # New line after progress bar
+        # Large files from servers that accept byte ranges are fetched as
+        # several parts in parallel, everything else as a single stream
+        range_size = 0
+        if parallel > 1:
+            head = _download_session.head(url, allow_redirects=True, timeout=DOWNLOAD_TIMEOUT)
+            if head.ok and head.headers.get('accept-ranges') == 'bytes':
+                range_size = int(head.headers.get('content-length', 0))
+        
+        # An interrupted single-stream download is resumed rather than restarted
+        downloaded_in_ranges = False
+        if range_size >= parallel * DOWNLOAD_MIN_PART_SIZE and not os.path.exists(f"{output_file}.part"):
+            downloaded_in_ranges = _download_ranges(head.url, output_file, range_size, parallel)
+            if not downloaded_in_ranges:
+                print_warning("Server ignored the byte range request, downloading as a single stream")
+        
+        if downloaded_in_ranges:
+            print()  # New line after progress bar
+            
+            # Parts complete out of order, so hash the assembled file afterwards
+            actual_hash = _file_sha256(output_file) if check_hash else None
+        else:
+            actual_hash = _download_stream(url, output_file, hash_content=bool(check_hash))
+            print()  # New line after progress bar
 
-        # Always verify hash after download if we have a full SHA256 hash
-        if expected_hash and len(expected_hash) == 64:
-            if verify_file_hash(output_file, expected_hash):
+        # Always verify hash after download if we have one
+        if check_hash:
+            if _hash_matches(output_file, actual_hash, check_hash):
+                _hash_cache.put(output_file, actual_hash)
                 print_success(f"Download completed and hash verified: {os.path.basename(output_file)}")
                 return True
             else:
@@ -1645,10 +2585,14 @@ def download_with_progress(url: str, output_file: str, verify_hash: bool = True,
             print_error(f"Failed to remove file after download error: {cleanup_error}")
         return False
 
+@functools.lru_cache(maxsize=None)
 def is_interactive_terminal() -> bool:
     """
     Check if the script is running in an interactive terminal session.
     
+    The answer cannot change during a run, so it is computed once; the parent
+    process lookup through psutil is comparatively expensive.
+    
     Returns:
         bool: True if running in an interactive terminal, False if running via cron or non-interactive
     """
@@ -1665,16 +2609,22 @@ def is_interactive_terminal() -> bool:
         if 'CRON' in os.environ or 'CRON_TZ' in os.environ:
             return False
             
-        # Check if parent process is a shell script or cron
+        # Check if parent process is a shell script or cron, reading its name
+        # straight from /proc where available instead of going through psutil
+        parent_name = None
         try:
-            import psutil
-            parent = psutil.Process().parent()
-            if parent:
-                parent_name = parent.name().lower()
-                if any(x in parent_name for x in ['cron', 'sh', 'bash', 'zsh', 'fish']):
-                    return False
-        except (ImportError, psutil.NoSuchProcess):
-            pass
+            with open(f"/proc/{os.getppid()}/comm") as comm:
+                parent_name = comm.read().strip().lower()
+        except OSError:
+            try:
+                import psutil
+                parent = psutil.Process().parent()
+                if parent:
+                    parent_name = parent.name().lower()
+            except (ImportError, psutil.NoSuchProcess):
+                pass
+        if parent_name and any(x in parent_name for x in ['cron', 'sh', 'bash', 'zsh', 'fish']):
+            return False
             
         return True
     except:
@@ -1695,35 +2645,43 @@ def print_device_info(device: str, ota: AndroidImageInfo, scraper: Optional[Andr
     """
     if file is None:
         file = sys.stderr
-        
-    print(f"\nDevice: {device}", file=file)
-    print(f"Android Version: {ota.android_version}", file=file)
-    print(f"Build Version: {ota.build_version}", file=file)
+    
+    # Collect the lines and write them at once rather than one print per field
+    lines = [
+        f"\nDevice: {device}",
+        f"Android Version: {ota.android_version}",
+        f"Build Version: {ota.build_version}",
+    ]
     if ota.sub_version:
-        print(f"Sub Version: {ota.sub_version}", file=file)
-    print(f"Release Date: {ota.release_date}", file=file)
+        lines.append(f"Sub Version: {ota.sub_version}")
+    lines.append(f"Release Date: {ota.release_date}")
     if ota.additional_info:
-        print(f"Additional Info: {ota.additional_info}", file=file)
-    print(f"Download URL: {ota.download_url}", file=file)
-    print(f"Filename: {ota.filename}", file=file)
+        lines.append(f"Additional Info: {ota.additional_info}")
+    lines.append(f"Download URL: {ota.download_url}")
+    lines.append(f"Filename: {ota.filename}")
     if ota.checksum:
-        print(f"Checksum: {ota.checksum}", file=file)
+        lines.append(f"Checksum: {ota.checksum}")
     if ota.is_beta:
-        print("Build Type: Beta", file=file)
+        lines.append("Build Type: Beta")
     elif ota.is_carrier:
-        print(f"Carrier: {ota.carrier}", file=file)
+        lines.append(f"Carrier: {ota.carrier}")
     elif ota.is_region_specific:
-        print(f"Region: {ota.region}", file=file)
+        lines.append(f"Region: {ota.region}")
     if ota.security_patch_level:
-        print(f"Security Patch Level: {ota.security_patch_level}", file=file)
-    print(file=file)  # Add blank line at end
+        lines.append(f"Security Patch Level: {ota.security_patch_level}")
+    lines.append("")  # Add blank line at end
+    file.write("\n".join(lines) + "\n")
+
+# Download progress bars for every whole percentage, built once
+PROGRESS_BAR_LENGTH = 50
+PROGRESS_BARS = tuple(
+    '=' * (PROGRESS_BAR_LENGTH * percent // 100) + '-' * (PROGRESS_BAR_LENGTH - PROGRESS_BAR_LENGTH * percent // 100)
+    for percent in range(101)
+)
 
 def print_download_progress(percent: int, downloaded: int, total: int) -> None:
     """Print download progress bar."""
-    bar_length = 50
-    filled_length = int(bar_length * percent / 100)
-    bar = '=' * filled_length + '-' * (bar_length - filled_length)
-    print(f'\rDownloading: [{bar}] {percent}% ({downloaded}/{total} bytes)', end='')
+    print(f'\rDownloading: [{PROGRESS_BARS[percent]}] {percent}% ({downloaded}/{total} bytes)', end='')
 
 def print_success(message: str) -> None:
     """Print a success message."""
@@ -1789,7 +2747,7 @@ class JsonOutputHandler:
         }
         
         # Use compact JSON format without whitespace
-        return json.dumps(sanitized_data, separators=(',', ':'))
+        return _json_text(sanitized_data)
     
     @classmethod
     def print_output(cls, data: Dict[str, Any], json_output: bool = False) -> None:
@@ -1813,7 +2771,7 @@ class JsonOutputHandler:
                 # Log error to stderr
                 logger.error("Failed to format JSON output: %s", e)
                 # Print error as JSON to stderr
-                print(json.dumps({"error": str(e)}), file=sys.stderr)
+                print(_json_text({"error": str(e)}), file=sys.stderr)
                 sys.exit(1)
         else:
             # For non-JSON output, use stderr for all messages
@@ -1835,7 +2793,8 @@ def main():
     parser.add_argument("--json", action="store_true", help="Output results in JSON format")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--non-interactive", action="store_true", help="Force non-interactive mode")
-    parser.add_argument("--verify-hash", nargs=2, help="Verify file hash")
+    parser.add_argument("--verify-hash", nargs=2, action="append", metavar=("FILE", "HASH"),
+                        help="Verify file hash (repeat to verify several files concurrently)")
     parser.add_argument("--list-devices", action="store_true", help="List all supported devices")
     parser.add_argument("--list-families", action="store_true", help="List all device families")
     parser.add_argument("--analyze-family", action="store_true", help="Analyze update status for a family")
@@ -1843,19 +2802,21 @@ def main():
     parser.add_argument("--clear-cache", action="store_true", help="Clear cache")
     parser.add_argument("--save-html", action="store_true", help="Save HTML content to file")
     parser.add_argument("--check-all", action="store_true", help="Check all devices for updates")
+    parser.add_argument("--max-workers", type=int, default=4, help="Maximum number of devices processed in parallel")
+    parser.add_argument("--refresh", action="store_true", help="Revalidate cached pages with Google instead of trusting them for a day")
     
     args = parser.parse_args()
     
     # Setup logging with JSON output flag
     setup_logging(debug=args.debug, json_output=args.json)
     
-    # Initialize scraper
-    scraper = AndroidImageScraper()
+    # Initialize scraper; with --refresh each cached page is revalidated once
+    # (and only downloaded again if it changed)
+    scraper = AndroidImageScraper(max_concurrency=args.max_workers, revalidate=args.refresh)
     
     # Handle verify-hash argument
     if args.verify_hash:
-        file_path, expected_hash = args.verify_hash
-        if verify_file_hash(file_path, expected_hash):
+        if all(verify_file_hashes([tuple(pair) for pair in args.verify_hash])):
             print("Hash verification successful")
             sys.exit(0)
         else:
@@ -1866,7 +2827,7 @@ def main():
     if args.cache_stats:
         stats = scraper.get_cache_statistics()
         if args.json:
-            print(json.dumps(stats))
+            print(_json_text(stats))
         else:
             print(f"Cache Statistics:")
             print(f"Total entries: {stats['total_entries']}")
@@ -1885,7 +2846,7 @@ def main():
     if args.list_devices:
         devices = scraper.get_all_devices()
         if args.json:
-            print(json.dumps({"devices": devices}))
+            print(_json_text({"devices": devices}))
         else:
             print("Supported devices:")
             for device in sorted(devices):
@@ -1896,7 +2857,7 @@ def main():
     if args.list_families:
         families = scraper.get_all_families()
         if args.json:
-            print(json.dumps({"families": families}))
+            print(_json_text({"families": families}))
         else:
             print("Supported device families:")
             for family in sorted(families):
@@ -1905,7 +2866,7 @@ def main():
     
     # Handle HTML saving
     if args.save_html:
-        html_content = scraper.fetch_page()
+        html_content = scraper.fetch_page(revalidate=args.refresh)
         if html_content:
             with open("ota_page.html", "w") as f:
                 f.write(html_content)
@@ -1918,7 +2879,7 @@ def main():
     if args.analyze_family and args.family:
         analysis = scraper.analyze_family_update_status(args.family)
         if args.json:
-            print(json.dumps(analysis))
+            print(_json_text(analysis))
         else:
             print(f"Update analysis for {args.family}:")
             for device, info in analysis.items():
@@ -1934,24 +2895,21 @@ def main():
     # Handle all devices check
     if args.check_all:
         devices = scraper.get_all_devices()
-        results = {}
-        for device in devices:
-            image = scraper.get_latest_ota(
-                device,
-                include_beta=args.include_beta,
-                include_carrier=args.include_carrier,
-                include_region_specific=args.include_region,
-                carrier=args.carrier,
-                region=args.region
-            )
-            if image:
-                results[device] = image.to_dict()
+        latest = scraper.get_latest_ota_for_devices(
+            devices,
+            include_beta=args.include_beta,
+            include_carrier=args.include_carrier,
+            include_region_specific=args.include_region,
+            carrier=args.carrier,
+            region=args.region
+        )
+        results = {device: image for device, image in latest.items() if image}
         
         if args.json:
-            print(json.dumps(results))
+            print(_json_text({device: image.to_dict() for device, image in results.items()}))
         else:
-            for device, info in results.items():
-                print_device_info(device, AndroidImageInfo(**info))
+            for device, image in results.items():
+                print_device_info(device, image)
         sys.exit(0)
     
     # Handle single device check
@@ -1970,29 +2928,13 @@ def main():
         
         if image:
             if args.json:
-                # Ensure all required fields are present
-                output = {
-                    "device": device,
-                    "android_version": image.android_version,
-                    "build_version": image.build_version,
-                    "release_date": image.release_date,
-                    "download_url": image.download_url,
-                    "filename": image.filename,
-                    "checksum": image.checksum,
-                    "security_patch_level": image.security_patch_level,
-                    "carrier": image.carrier,
-                    "region": image.region,
-                    "is_factory": args.factory
-                }
-                # Remove None values
-                output = {k: v for k, v in output.items() if v is not None}
                 # Print as single-line JSON
-                print(json.dumps(output, separators=(',', ':')))
+                print(_json_text(image.to_output_dict(device, args.factory)))
             else:
                 print_device_info(device, image)
         else:
             if args.json:
-                print(json.dumps({"error": f"No {'factory image' if args.factory else 'OTA'} found for device: {device}"}))
+                print(_json_text({"error": f"No {'factory image' if args.factory else 'OTA'} found for device: {device}"}))
             else:
                 print_error(f"No {'factory image' if args.factory else 'OTA'} found for device: {device}")
     